@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
+import random
+import re
 import time
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Iterable
 
 from daalu.execution.runner import CommandRunner
 from .template_renderer import TemplateRenderer
@@ -28,6 +30,51 @@ import logging
 log = logging.getLogger("daalu")
 
 
+def _backoff_delay(attempt: int, cap: float) -> float:
+    """
+    Exponential poll delay with jitter: ~3s, 4s, 6s, 10s, ... capped at `cap`.
+    """
+    return min(cap, 2 + 2 ** attempt + random.uniform(0, 1))
+
+
+def _scan_describe_ready(
+    lines: Iterable[str], cluster_name: str, seen: list[str]
+) -> tuple[bool, bool]:
+    """
+    Read `clusterctl describe cluster` output line by line (appending each
+    line to `seen`) and return the READY columns of the Cluster and its
+    KubeadmControlPlane. Only the first row for each counts, and reading
+    stops once both rows have been seen.
+    """
+    # The lookbehind keeps Metal3Cluster/<name>, DockerCluster/<name>, ...
+    # from being taken for the top-level Cluster/<name> row.
+    cluster_re = re.compile(
+        rf"(?<![A-Za-z])Cluster/{re.escape(cluster_name)}\s+(\S+)"
+    )
+    kcp_re = re.compile(
+        rf"KubeadmControlPlane/{re.escape(cluster_name)}-control-plane\s+(\S+)"
+    )
+
+    cluster_ready: bool | None = None
+    control_plane_ready: bool | None = None
+    for line in lines:
+        seen.append(line)
+
+        if cluster_ready is None:
+            m = cluster_re.search(line)
+            if m:
+                cluster_ready = m.group(1) == "True"
+        if control_plane_ready is None:
+            m = kcp_re.search(line)
+            if m:
+                control_plane_ready = m.group(1) == "True"
+
+        if cluster_ready is not None and control_plane_ready is not None:
+            break
+
+    return bool(cluster_ready), bool(control_plane_ready)
+
+
 class ClusterAPIManager:
     """
     Applies Cluster API manifests on the MANAGEMENT cluster and waits until the
@@ -47,6 +94,18 @@ class ClusterAPIManager:
         self.kubeconfig = kubeconfig
         self.base_dir = repo_root / "cluster-defs"
         self.cluster_api_dir = self.base_dir / "cluster-api"
+        self._renderer = TemplateRenderer(repo_root / "templates/cluster-api")
+
+        # argv prefixes only depend on the kubeconfig/context, so build them once
+        self._kubectl_base = (
+            "kubectl",
+            *(("--kubeconfig", kubeconfig) if kubeconfig else ()),
+            *(("--context", mgmt_context) if mgmt_context else ()),
+        )
+        self._clusterctl_base = (
+            "clusterctl",
+            *(("--kubeconfig", kubeconfig) if kubeconfig else ()),
+        )
 
         self.ctx = ctx
         self.runner = CommandRunner(
@@ -63,18 +122,10 @@ class ClusterAPIManager:
     # -------------------------------------------------------------------------
 
     def _kubectl(self) -> list[str]:
-        cmd = ["kubectl"]
-        if self.kubeconfig:
-            cmd += ["--kubeconfig", self.kubeconfig]
-        if self.mgmt_context:
-            cmd += ["--context", self.mgmt_context]
-        return cmd
+        return list(self._kubectl_base)
 
     def _clusterctl(self) -> list[str]:
-        cmd = ["clusterctl"]
-        if self.kubeconfig:
-            cmd += ["--kubeconfig", self.kubeconfig]
-        return cmd
+        return list(self._clusterctl_base)
 
     # -------------------------------------------------------------------------
     # Render manifests only
@@ -85,8 +136,7 @@ class ClusterAPIManager:
         Render the full Cluster API manifests (Secret + Cluster YAML) into
         a single combined YAML string without applying them.
         """
-        templates_dir = self.repo_root / "templates/cluster-api"
-        renderer = TemplateRenderer(templates_dir)
+        renderer = self._renderer
         context = config.cluster_api.model_dump()
 
         rendered_docs = []
@@ -109,8 +159,7 @@ class ClusterAPIManager:
             )
         )
 
-        templates_dir = self.repo_root / "templates/cluster-api"
-        renderer = TemplateRenderer(templates_dir)
+        renderer = self._renderer
         context = config.cluster_api.model_dump()
 
         for tmpl in ["cluster-api-secret.yaml.j2", "cluster-api.yaml.j2"]:
@@ -210,50 +259,38 @@ class ClusterAPIManager:
             # Poll readiness via clusterctl
             # -------------------------------------------------------------
             start = time.time()
+            desc_cmd = [
+                *self._clusterctl_base,
+                "describe",
+                "cluster",
+                cluster_name,
+                "-n",
+                namespace,
+            ]
+
+            attempt = 0
+            last_status = None
 
             while True:
-                desc_cmd = self._clusterctl() + [
-                    "describe",
-                    "cluster",
-                    cluster_name,
-                    "-n",
-                    namespace,
-                ]
-
-                result = self.runner.run(
-                    desc_cmd,
-                    capture_output=True,
-                    check=False,
-                )
-
-                out = (
-                    result.stdout
-                    if result.returncode == 0
-                    else result.stderr
-                ) or ""
+                # Stream the describe output and stop reading as soon as both
+                # READY columns have been seen.
+                lines: list[str] = []
+                stream = self.runner.run_streaming(desc_cmd)
+                try:
+                    cluster_ready, control_plane_ready = _scan_describe_ready(
+                        stream, cluster_name, lines
+                    )
+                finally:
+                    stream.close()
 
                 self.bus.emit(
                     ClusterAPIStatusUpdate(
                         name=cluster_name,
-                        output=out.strip(),
+                        output="".join(lines).strip(),
                         **self.run_ctx,
                     )
                 )
 
-                # Same crude readiness heuristic (unchanged)
-                cluster_ready = (
-                    f"Cluster/{cluster_name}" in out
-                    and "True"
-                    in out.split(f"Cluster/{cluster_name}")[1].split()[0]
-                )
-
-                kcp = f"KubeadmControlPlane/{cluster_name}-control-plane"
-                control_plane_ready = (
-                    kcp in out
-                    and "True"
-                    in out.split(kcp)[1].split()[0]
-                )
-
                 if cluster_ready and control_plane_ready:
                     log.debug("[ClusterAPI] Cluster and control plane are ready.")
                     self.bus.emit(
@@ -278,7 +315,14 @@ class ClusterAPIManager:
                         f"[ClusterAPI] Cluster {cluster_name} not ready after {timeout} seconds"
                     )
 
-                time.sleep(interval)
+                # Poll quickly again whenever the status moves, back off otherwise
+                status = (cluster_ready, control_plane_ready)
+                if status != last_status:
+                    attempt = 0
+                    last_status = status
+
+                time.sleep(_backoff_delay(attempt, interval))
+                attempt += 1
 
             log.debug("[ClusterAPI] Bootstrap completed successfully.")
             self.bus.emit(
@@ -19,6 +19,18 @@ import logging
 
 log = logging.getLogger("daalu")
 
+# Formatted UTC timestamp for the current second; strftime only runs once
+# per second no matter how many log lines are written.
+_ts_cache = {"sec": 0, "str": ""}
+
+
+def _fmt_ts() -> str:
+    now = int(time.time())
+    if now != _ts_cache["sec"]:
+        _ts_cache["str"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _ts_cache["sec"] = now
+    return _ts_cache["str"]
+
 
 class CSIBase:
     def __init__(
@@ -36,6 +48,25 @@ class CSIBase:
         self.run_ctx = new_ctx(env=env, context=context)
 
         self._log_file = self._init_log_file()
+        # Single line-buffered handle for the lifetime of the driver instead
+        # of re-opening the log file for every command.
+        self._log_fh = open(self._log_file, "a", encoding="utf-8", buffering=1)
+
+    def close(self) -> None:
+        """Close the CSI log file handle."""
+        if not self._log_fh.closed:
+            self._log_fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        fh = getattr(self, "_log_fh", None)
+        if fh is not None and not fh.closed:
+            fh.close()
 
     # ------------------------------------------------------------------
     # Logging
@@ -59,8 +90,8 @@ class CSIBase:
     # ------------------------------------------------------------------
 
     def _run(self, *, cli, cmd: str, hostname: str, env=None, sudo=True):
-        log_file = self._log_file
-        start_ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        fh = self._log_fh
+        start_ts = _fmt_ts()
 
         prefix = ""
         if env:
@@ -71,17 +102,15 @@ class CSIBase:
         if sudo:
             final = f"sudo -S {final}"
 
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(f"\n[{start_ts}] ({hostname}) $ {final}\n")
+        fh.write(f"\n[{start_ts}] ({hostname}) $ {final}\n")
 
         rc, out, err = cli.run(final, sudo=False)
 
-        with open(log_file, "a", encoding="utf-8") as f:
-            if out:
-                f.write(f"({hostname}) [stdout]\n{out}\n")
-            if err:
-                f.write(f"({hostname}) [stderr]\n{err}\n")
-            f.write(f"({hostname}) [exit {rc}]\n")
+        if out:
+            fh.write(f"({hostname}) [stdout]\n{out}\n")
+        if err:
+            fh.write(f"({hostname}) [stderr]\n{err}\n")
+        fh.write(f"({hostname}) [exit {rc}]\n")
 
         return rc, out, err
 
@@ -92,11 +121,10 @@ class CSIBase:
 
 
     def _log(self, message: str) -> None:
-        ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        ts = _fmt_ts()
         line = f"[{ts}] {message}"
-        log.debug(line, flush=True)
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        log.debug(line)
+        self._log_fh.write(line + "\n")
 
     def _ctx(self) -> dict:
         """
@@ -25,6 +25,7 @@ class CSIManager:
         self.helm = helm
         self.ceph_hosts = ceph_hosts
         self.connect_timeout = connect_timeout
+        self._helm_verified = False
 
         if not ceph_hosts:
             raise RuntimeError("CSI requires at least one Ceph host")
@@ -38,9 +39,13 @@ class CSIManager:
         Ensure Helm is installed on the remote host.
         Installs Helm into /usr/local/bin/helm if missing.
         """
+        if self._helm_verified:
+            return
+
         # Check if helm exists
         rc, out, err = ssh.run("command -v helm", sudo=True)
         if rc == 0:
+            self._helm_verified = True
             return  # Helm already installed
 
         log.debug("[csi] Helm not found on remote host, installing Helm...")
@@ -71,6 +76,7 @@ class CSIManager:
         if rc != 0:
             raise RuntimeError(f"Helm installed but not usable: {err or out}")
 
+        self._helm_verified = True
         log.debug(f"[csi] Helm installed successfully: {out.strip()}")
 
     # ------------------------------------------------------------------
@@ -96,22 +102,26 @@ class CSIManager:
             # connect_timeout=self.connect_timeout,
         )
 
+        driver = None
         try:
             #  Ensure Helm exists BEFORE using HelmCliRunner
             self._ensure_helm(ssh)
 
             if cfg.driver == "rbd":
-                CephRbdCsiDriver(
+                driver = CephRbdCsiDriver(
                     bus=self.bus,
                     helm=self.helm,
                     ssh=ssh,
                     host=self.primary_host,
                     env="workload",
                     context=cfg.kubeconfig_path,
-                ).deploy(cfg)
+                )
+                driver.deploy(cfg)
 
             else:
                 raise RuntimeError(f"Unsupported CSI driver: {cfg.driver}")
 
         finally:
+            if driver is not None:
+                driver.close()
             ssh.close()
@@ -13,6 +13,7 @@ from daalu.bootstrap.csi.helm_values import rbd_values
 from daalu.bootstrap.csi.events import (
     CSIStarted, CSIProgress, CSIFailed, CSISucceeded
 )
+from daalu.utils.dirhash import sha256_tree
 
 import yaml
 
@@ -22,13 +23,15 @@ log = logging.getLogger("daalu")
 ASSETS_DIR = Path(__file__).resolve().parents[4] / "assets" / "csi"
 LOCAL_CHART_DIR = ASSETS_DIR / "charts"
 REMOTE_CHART_DIR = Path("/usr/local/src/ceph-csi-rbd")
+REMOTE_CHART_HASH = REMOTE_CHART_DIR / ".daalu-sha256"
 
 
 def load_yaml_file(path: Path) -> dict:
-    if not path.exists():
-        raise FileNotFoundError(f"CSI values file not found: {path}")
-    with path.open() as f:
-        return yaml.safe_load(f) or {}
+    try:
+        with path.open() as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSI values file not found: {path}") from None
 
 
 def deep_merge(dst: dict, src: dict):
@@ -69,17 +72,28 @@ class CephRbdCsiDriver(CSIBase):
         other components (cinder, glance, etc.).
         """
         local_chart = LOCAL_CHART_DIR / "ceph-csi-rbd"
-        if not local_chart.exists():
+        try:
+            next(local_chart.iterdir())
+        except (FileNotFoundError, NotADirectoryError, StopIteration):
             raise FileNotFoundError(
                 f"Vendored chart not found at {local_chart}. "
                 f"Run: helm repo add ceph-csi https://ceph.github.io/csi-charts && "
                 f"helm pull ceph-csi/ceph-csi-rbd --version 3.11.0 "
                 f"--untar --untardir {LOCAL_CHART_DIR}"
-            )
+            ) from None
 
         # Upload to the controller node (self.helm.ssh), NOT the ceph host
         # (self.ssh), because helm runs on the controller.
         controller_ssh = self.helm.ssh
+        remote_chart = REMOTE_CHART_DIR / "ceph-csi-rbd"
+
+        # Skip the transfer when the controller already has this exact chart
+        local_hash = sha256_tree(LOCAL_CHART_DIR)
+        rc, out, _ = controller_ssh.run(f"cat {REMOTE_CHART_HASH}", sudo=True)
+        if rc == 0 and out.strip() == local_hash:
+            log.info("[csi] ceph-csi-rbd chart unchanged on controller, skipping upload")
+            return remote_chart
+
         log.info("[csi] Uploading ceph-csi-rbd chart to controller node...")
         controller_ssh.run(f"mkdir -p {REMOTE_CHART_DIR}", sudo=True)
         controller_ssh.put_dir(
@@ -88,7 +102,9 @@ class CephRbdCsiDriver(CSIBase):
             release_name="ceph-csi-rbd",
             sudo=True,
         )
-        return REMOTE_CHART_DIR / "ceph-csi-rbd"
+        # put_dir replaces REMOTE_CHART_DIR, so the marker goes in last
+        controller_ssh.put_text(local_hash, str(REMOTE_CHART_HASH), sudo=True)
+        return remote_chart
 
     def deploy(self, cfg):
         self.bus.emit(CSIStarted(
@@ -6,14 +6,57 @@ from abc import ABC
 from dataclasses import dataclass
 from pathlib import Path
 import logging
-import yaml
+import shutil
 from typing import Optional
+import urllib.error
 import urllib.request
 import time
 import requests
 
+from daalu.k8s import client as k8s_client
+from daalu.utils.yaml_cache import load_yaml_file
+
 log = logging.getLogger("daalu")
 
+# Seconds to wait on the Argo CD manifest download before giving up.
+ARGOCD_MANIFEST_TIMEOUT = 30
+
+
+def _download_argocd_manifest(url: str, target: Path) -> None:
+    """
+    Download `url` to `target`, revalidating a previous copy by ETag.
+
+    The ETag is kept next to the manifest (`<app>.etag`); when the server
+    answers 304 Not Modified the cached file is reused as-is.
+    """
+    etag_path = target.with_suffix(".etag")
+    headers = {}
+    if target.is_file() and etag_path.is_file():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(
+            request, timeout=ARGOCD_MANIFEST_TIMEOUT
+        ) as resp:
+            # Write to a sibling file first so an interrupted download never
+            # leaves a truncated manifest paired with a valid ETag.
+            partial = target.with_suffix(".part")
+            with partial.open("wb") as f:
+                shutil.copyfileobj(resp, f, length=64 * 1024)
+            partial.replace(target)
+            etag = resp.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        log.debug("Argo CD manifest %s not modified, using cached copy", url)
+        return
+
+    if etag:
+        etag_path.write_text(etag)
+    else:
+        etag_path.unlink(missing_ok=True)
+
 
 
 @dataclass
@@ -67,6 +110,10 @@ class InfraComponent(ABC):
 
     istio_expected_status: int = 300
 
+    def __post_init__(self) -> None:
+        # Subclasses assign their own values after super().__init__().
+        self._values: dict = {}
+
     # ------------------------
     # Hooks
     # ------------------------
@@ -76,21 +123,48 @@ class InfraComponent(ABC):
         """
         Load a Helm values YAML file from disk.
 
-        Returns an empty dict if the file does not exist.
+        Returns an empty dict if the file is empty; raises FileNotFoundError
+        if it does not exist.
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Helm values file not found: {path}")
+        try:
+            return load_yaml_file(path) or {}
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Helm values file not found: {path}") from None
+
+    def _local_api_client(self):
+        """
+        Shared ApiClient for this component's cluster, or None.
+
+        Only available when the kubernetes package is installed and
+        `kubeconfig` exists on this machine (it usually names a path on the
+        remote control-plane host, where kubectl runs over SSH). The
+        client is built once per kubeconfig for the process.
+        """
+        if k8s_client.client is None or not self.kubeconfig:
+            return None
+        if not Path(self.kubeconfig).is_file():
+            return None
+        return k8s_client.get_api_client(self.kubeconfig)
 
-        with path.open("r") as f:
-            data = yaml.safe_load(f)
+    def core_v1_api(self):
+        """CoreV1Api over _local_api_client(), or None."""
+        api = self._local_api_client()
+        return k8s_client.client.CoreV1Api(api) if api is not None else None
 
-        return data or {}
+    def batch_v1_api(self):
+        """BatchV1Api over _local_api_client(), or None."""
+        api = self._local_api_client()
+        return k8s_client.client.BatchV1Api(api) if api is not None else None
 
     def assets_dir(self) -> Path | None:
         return None 
 
     def _argocd_config(self) -> dict | None:
+        # Components either keep the base assets_dir() method or shadow it
+        # with a plain Path attribute.
         assets = self.assets_dir
+        if callable(assets):
+            assets = assets()
         if not assets:
             return None
 
@@ -98,7 +172,7 @@ class InfraComponent(ABC):
         if not config_path.exists():
             return  None
 
-        data = yaml.safe_load(config_path.read_text()) or {}
+        data = load_yaml_file(config_path) or {}
 
         try:
             return data["argocd"]["app"]
@@ -111,7 +185,7 @@ class InfraComponent(ABC):
         """
         Helm values.
         """
-        return getattr(self, "_values", {}) or {}
+        return self._values
 
 
     def _onboard_to_argocd(self, kubectl) -> None:
@@ -148,8 +222,7 @@ class InfraComponent(ABC):
         target = Path(f"/tmp/daalu/argocd/{app_name}.yaml")
         target.parent.mkdir(parents=True, exist_ok=True)
 
-        with urllib.request.urlopen(manifest_url) as resp:
-            target.write_text(resp.read().decode())
+        _download_argocd_manifest(manifest_url, target)
 
         # 4. Apply manifest
         kubectl.apply_file(target)
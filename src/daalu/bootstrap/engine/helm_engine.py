@@ -8,7 +8,7 @@ from __future__ import annotations
 import logging
 
 from daalu.bootstrap.engine.chart_manager import prepare_chart
-from daalu.bootstrap.engine.values import deep_merge
+from daalu.bootstrap.engine.values import deep_merge_into
 from daalu.kube.kubectl import KubectlRunner
 from daalu.config.models import RepoSpec
 from daalu.bootstrap.engine.infra_logging import InfraJsonlLogger
@@ -21,6 +21,14 @@ class HelmInfraEngine:
         self.helm = helm
         self.ssh = ssh
         self.logger = logger
+        # {(namespace, release)} already deployed; filled by
+        # load_deployed_releases so each component skips its own
+        # `helm status` call.
+        self._deployed_releases: set[tuple[str, str]] | None = None
+        # {(repo_name, repo_url)} added by this engine; one `helm repo
+        # update` before the next install covers every repo added since.
+        self._synced_repos: set[tuple[str, str]] = set()
+        self._repos_need_update = False
 
     def base_values(self, component) -> dict:
         """
@@ -32,6 +40,14 @@ class HelmInfraEngine:
     # Valid phases for --phase filtering
     VALID_PHASES = {"pre_install", "helm", "post_install"}
 
+    # phase -> (run_pre, run_helm, run_post)
+    _PHASE_FLAGS = {
+        None: (True, True, True),
+        "pre_install": (True, False, False),
+        "helm": (False, True, False),
+        "post_install": (False, False, True),
+    }
+
     def deploy(self, component, *, phase: str | None = None):
         """
         Deploy a component through its lifecycle phases.
@@ -42,29 +58,26 @@ class HelmInfraEngine:
                    One of "pre_install", "helm", "post_install".
                    If None, all phases run (default behaviour).
         """
-        if phase and phase not in self.VALID_PHASES:
+        flags = self._PHASE_FLAGS.get(phase or None)
+        if flags is None:
             raise ValueError(
                 f"Invalid phase '{phase}'. "
                 f"Valid phases: {', '.join(sorted(self.VALID_PHASES))}"
             )
-
-        run_pre = phase in (None, "pre_install")
-        run_helm = phase in (None, "helm")
-        run_post = phase in (None, "post_install")
-
-        log.info("[%s] Starting deployment...", component.name)
+        run_pre, run_helm, run_post = flags
 
         # ---------------- Context ----------------
         if self.logger:
             self.logger.set_component(component.name)
             self.logger.set_stage("init")
-            self.logger.log_event(
-                "infra.component.deploy.start",
-                component=component.name,
-                namespace=component.namespace,
-                release=component.release_name,
-                phase=phase or "all",
-            )
+        self._say(
+            component,
+            "infra.component.deploy.start",
+            "Starting deployment...",
+            namespace=component.namespace,
+            release=component.release_name,
+            phase=phase or "all",
+        )
 
         kubectl = KubectlRunner(
             ssh=self.ssh,
@@ -77,153 +90,232 @@ class HelmInfraEngine:
             # 1. Pre-install
             # ============================================================
             if run_pre:
-                log.info("[%s] Running pre-install...", component.name)
                 if self.logger:
                     self.logger.set_stage("pre_install")
-                    self.logger.log_event(
-                        "infra.component.pre_install.start",
-                        component=component.name,
-                    )
+                self._say(component, "infra.component.pre_install.start", "Running pre-install...")
 
                 component.pre_install(kubectl)
 
-                log.info("[%s] Pre-install complete", component.name)
-                if self.logger:
-                    self.logger.log_event(
-                        "infra.component.pre_install.success",
-                        component=component.name,
-                    )
+                self._say(component, "infra.component.pre_install.success", "Pre-install complete")
 
             # ============================================================
-            # 2. Helm-backed components
+            # 2-3. Helm install, or kubectl-only marker
             # ============================================================
-            if run_helm and component.uses_helm:
-                # ---------------- Helm repo ----------------
-                if component.local_chart_dir is None:
-                    if self.logger:
-                        self.logger.set_stage("helm.repo")
-
-                    if not component.repo_name or not component.repo_url:
-                        raise ValueError(
-                            f"Component {component.name} is marked uses_helm=True "
-                            f"but repo_name/repo_url is missing"
-                        )
-
-                    self.helm.add_repo(
-                        RepoSpec(
-                            name=component.repo_name,
-                            url=component.repo_url,
-                        )
-                    )
-                    self.helm.update_repos()
+            if run_helm:
+                self._run_helm_phase(component, kubectl)
 
-                # ---------------- Chart prep ----------------
+            # ============================================================
+            # 4. Post-install
+            # ============================================================
+            if run_post:
+                log.info("[%s] Running post-install...", component.name)
                 if self.logger:
-                    self.logger.set_stage("chart.prepare")
+                    self.logger.set_stage("post_install")
 
-                chart_path = prepare_chart(
-                    ssh=self.ssh,
-                    component=component,
-                )
+                component.post_install(kubectl)
 
-                if self.logger:
-                    self.logger.log_event(
-                        "infra.chart.ready",
-                        chart=str(chart_path),
-                    )
+            self._say(component, "infra.component.deploy.success", "Deployed successfully")
+            if self.logger:
+                self.logger.flush()
+
+        except Exception as e:
+            self._say(
+                component,
+                "infra.component.deploy.failed",
+                "Deployment failed: %s",
+                e,
+                level=logging.ERROR,
+                error=str(e),
+            )
+            if self.logger:
+                self.logger.flush()
+            raise
 
-                # ---------------- Values layering ----------------
+    def _say(
+        self,
+        component,
+        event_name: str,
+        msg_fmt: str,
+        *args,
+        level: int = logging.INFO,
+        **fields,
+    ) -> None:
+        """
+        Emit one lifecycle step to both sinks: the "[name] ..." line on the
+        daalu logger and the matching JSONL event, so the two cannot drift.
+        `args` fill `msg_fmt`; `fields` only go to the structured event.
+        """
+        log.log(level, "[%s] " + msg_fmt, component.name, *args)
+        if self.logger:
+            self.logger.log_event(event_name, component=component.name, **fields)
+
+    def _run_helm_phase(self, component, kubectl) -> None:
+        """Helm repo/chart/values/install/wait, or the kubectl-only marker."""
+        # ============================================================
+        # 2. Helm-backed components
+        # ============================================================
+        if component.uses_helm:
+            # ---------------- Helm repo ----------------
+            if component.local_chart_dir is None:
                 if self.logger:
-                    self.logger.set_stage("values.merge")
+                    self.logger.set_stage("helm.repo")
+
+                self._ensure_repo(component)
 
-                values = deep_merge(
-                    self.base_values(component),
-                    component.values(),
+            # ---------------- Chart prep ----------------
+            if self.logger:
+                self.logger.set_stage("chart.prepare")
+
+            chart_path = prepare_chart(
+                ssh=self.ssh,
+                component=component,
+            )
+
+            if self.logger:
+                self.logger.log_event(
+                    "infra.chart.ready",
+                    chart=str(chart_path),
                 )
 
-                # Dump merged values for debugging
-                #import json
-                #log.info(
-                #    "[%s] === Merged Helm values ===\n%s",
-                #    component.name,
-                #    json.dumps(values, indent=2, default=str),
-                #)
+            # ---------------- Values layering ----------------
+            if self.logger:
+                self.logger.set_stage("values.merge")
 
-                # ---------------- Install / upgrade ----------------
-                if self.logger:
-                    self.logger.set_stage("helm.install_or_upgrade")
-
-                if self.helm.release_is_deployed(
-                    component.release_name, component.namespace,
-                ):
-                    log.info(
-                        "[%s] Helm release '%s' already deployed in '%s' -- skipping",
-                        component.name, component.release_name, component.namespace,
-                    )
-                else:
-                    log.info("[%s] Installing helm chart...", component.name)
-                    self.helm.install_or_upgrade(
-                        name=component.release_name,
-                        chart=str(chart_path),
-                        namespace=component.namespace,
-                        values=values,
-                        kubeconfig=component.kubeconfig,
-                        wait=False,
-                        atomic=False
+            # base_values() builds a fresh dict per call, so merge into it
+            values = deep_merge_into(
+                self.base_values(component),
+                component.values(),
+            )
 
-                    )
-                    log.info("[%s] Helm install command completed", component.name)
+            # Dump merged values for debugging
+            #import json
+            #log.info(
+            #    "[%s] === Merged Helm values ===\n%s",
+            #    component.name,
+            #    json.dumps(values, indent=2, default=str),
+            #)
 
-                # ---------------- Wait ----------------
-                if component.wait_for_pods:
-                    log.info(
-                        "[%s] Waiting for pods to be ready in namespace '%s'...",
-                        component.name, component.namespace,
-                    )
-                    if self.logger:
-                        self.logger.set_stage("kubectl.wait")
+            # ---------------- Install / upgrade ----------------
+            if self.logger:
+                self.logger.set_stage("helm.install_or_upgrade")
+
+            if self._release_is_deployed(component):
+                log.info(
+                    "[%s] Helm release '%s' already deployed in '%s' -- skipping",
+                    component.name, component.release_name, component.namespace,
+                )
+            else:
+                self._update_repos_if_needed()
+                log.info("[%s] Installing helm chart...", component.name)
+                self.helm.install_or_upgrade(
+                    name=component.release_name,
+                    chart=str(chart_path),
+                    namespace=component.namespace,
+                    values=values,
+                    kubeconfig=component.kubeconfig,
+                    wait=False,
+                    atomic=False
 
-                    kubectl.wait_for_pods_running(
-                        namespace=component.namespace,
-                        min_running=component.min_running_pods,
+                )
+                if self._deployed_releases is not None:
+                    self._deployed_releases.add(
+                        (component.namespace, component.release_name)
                     )
-                    log.info("[%s] Pods are ready", component.name)
+                log.info("[%s] Helm install command completed", component.name)
 
-            elif run_helm and not component.uses_helm:
-                # ============================================================
-                # 3. Kubectl-only components (no Helm)
-                # ============================================================
-                log.debug("[%s] Component does not use helm", component.name)
+            # ---------------- Wait ----------------
+            if component.wait_for_pods:
+                log.info(
+                    "[%s] Waiting for pods to be ready in namespace '%s'...",
+                    component.name, component.namespace,
+                )
                 if self.logger:
-                    self.logger.set_stage("kubectl.only")
-                    self.logger.log_event(
-                        "infra.component.kubectl_only",
-                        component=component.name,
-                    )
+                    self.logger.set_stage("kubectl.wait")
 
+                kubectl.wait_for_pods_running(
+                    namespace=component.namespace,
+                    min_running=component.min_running_pods,
+                )
+                log.info("[%s] Pods are ready", component.name)
+
+        else:
             # ============================================================
-            # 4. Post-install
+            # 3. Kubectl-only components (no Helm)
             # ============================================================
-            if run_post:
-                log.info("[%s] Running post-install...", component.name)
-                if self.logger:
-                    self.logger.set_stage("post_install")
+            if self.logger:
+                self.logger.set_stage("kubectl.only")
+            self._say(
+                component,
+                "infra.component.kubectl_only",
+                "Component does not use helm",
+                level=logging.DEBUG,
+            )
 
-                component.post_install(kubectl)
+    def add_repos(self, components) -> None:
+        """
+        `helm repo add` every repo the batch charts from, so the first
+        install refreshes them all with a single `helm repo update`.
+        Call before deploying `components` with this engine.
+        """
+        for component in components:
+            # Misconfigured components still fail in their own deploy()
+            if (
+                component.uses_helm
+                and component.local_chart_dir is None
+                and component.repo_name
+                and component.repo_url
+            ):
+                self._ensure_repo(component)
+
+    def _ensure_repo(self, component) -> None:
+        """
+        `helm repo add` once per repo for this engine, however many
+        components chart from it; the update is deferred to the next install.
+        """
+        if not component.repo_name or not component.repo_url:
+            raise ValueError(
+                f"Component {component.name} is marked uses_helm=True "
+                f"but repo_name/repo_url is missing"
+            )
 
-            log.info("[%s] Deployed successfully", component.name)
-            if self.logger:
-                self.logger.log_event(
-                    "infra.component.deploy.success",
-                    component=component.name,
-                )
+        key = (component.repo_name, component.repo_url)
+        if key in self._synced_repos:
+            return
+        self.helm.add_repo(
+            RepoSpec(
+                name=component.repo_name,
+                url=component.repo_url,
+            )
+        )
+        self._synced_repos.add(key)
+        self._repos_need_update = True
+
+    def _update_repos_if_needed(self) -> None:
+        if self._repos_need_update:
+            self.helm.update_repos()
+            self._repos_need_update = False
+
+    def _release_is_deployed(self, component) -> bool:
+        if self._deployed_releases is not None:
+            return (component.namespace, component.release_name) in self._deployed_releases
+        return self.helm.release_is_deployed(
+            component.release_name, component.namespace,
+        )
 
+    def load_deployed_releases(self, components) -> None:
+        """
+        Fetch deployed releases for every namespace in the batch with one
+        `helm list`; on failure, fall back to per-component checks.
+        Call before deploying `components` with this engine.
+        """
+        list_releases = getattr(self.helm, "list_releases", None)
+        if list_releases is None:
+            return
+        namespaces = {c.namespace for c in components if c.uses_helm}
+        if not namespaces:
+            return
+        try:
+            self._deployed_releases = list_releases(namespaces)
         except Exception as e:
-            log.error("[%s] Deployment failed: %s", component.name, e)
-            if self.logger:
-                self.logger.log_event(
-                    "infra.component.deploy.failed",
-                    component=component.name,
-                    error=str(e),
-                )
-            raise
+            log.debug("helm list failed (%s); checking releases one by one", e)
+            self._deployed_releases = None
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 import time
 import uuid
@@ -15,6 +16,14 @@ from typing import Optional, Tuple, Any
 
 from daalu.utils.ssh_runner import SSHRunner
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when missing
+    orjson = None
+
+# Events are buffered and flushed at phase boundaries (see flush())
+_BUFFER_SIZE = 64 * 1024
+
 
 def _utc_ts() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -44,6 +53,11 @@ class InfraJsonlLogger:
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.path = self.log_dir / f"{self.run_id}.jsonl"
 
+        self._fh = io.BufferedWriter(
+            open(self.path, "ab", buffering=0),
+            buffer_size=_BUFFER_SIZE,
+        )
+
         # Initialize file with a header event
         self._write(
             {
@@ -97,10 +111,33 @@ class InfraJsonlLogger:
             stderr=stderr,
         )
 
+    def flush(self) -> None:
+        """Push buffered events to disk."""
+        if not self._fh.closed:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
+
+    def __enter__(self) -> "InfraJsonlLogger":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def _write(self, obj: dict) -> None:
-        line = json.dumps(obj, ensure_ascii=False)
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        if orjson is not None:
+            line = orjson.dumps(obj) + b"\n"
+        else:
+            line = (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+        if self._fh.closed:
+            # Late events (e.g. a runner still wrapping this logger) are
+            # appended straight to the file instead of failing.
+            with open(self.path, "ab") as fh:
+                fh.write(line)
+            return
+        self._fh.write(line)
 
 
 class LoggedSSHRunner(SSHRunner):
@@ -3,11 +3,34 @@
 
 # src/daalu.bootstrap.engine/values.py
 
+def _merge(dst: dict, src: dict, *, copy: bool) -> None:
+    # Explicit worklist instead of recursion. With copy=True a nested dict
+    # from dst is shallow-copied before it is written to, so the caller's
+    # input is never mutated; values only present in src are shared as-is.
+    stack = [(dst, src)]
+    while stack:
+        d, s = stack.pop()
+        for k, v in s.items():
+            cur = d.get(k)
+            if isinstance(v, dict) and isinstance(cur, dict):
+                if copy:
+                    cur = d[k] = dict(cur)
+                stack.append((cur, v))
+            else:
+                d[k] = v
+
+
 def deep_merge(a: dict, b: dict) -> dict:
     out = dict(a)
-    for k, v in b.items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = deep_merge(out[k], v)
-        else:
-            out[k] = v
+    _merge(out, b, copy=True)
     return out
+
+
+def deep_merge_into(dst: dict, src: dict) -> dict:
+    """
+    Merge src into dst in place and return dst.
+
+    Only for callers that own dst (including its nested dicts).
+    """
+    _merge(dst, src, copy=False)
+    return dst
@@ -6,31 +6,125 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import subprocess
 import tempfile
 
 try:
-    from jinja2 import Environment, FileSystemLoader
+    import orjson
+except ImportError:  # optional; falls back to stdlib json
+    orjson = None
+
+try:
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 except Exception:
     Environment = None  # optional dep; tests will skip template rendering if missing
 
+try:
+    from urllib3.exceptions import HTTPError as _TransportError
+except ImportError:  # only installed alongside the kubernetes client
+    _TransportError = OSError
+
+from daalu.k8s import client as k8s_client
+
 log = logging.getLogger("daalu")
 
+# Matches a hosts-file line naming the host as a whole word
+_HOST_LINE_TMPL = r"\b{}(?:\s|$)"
+
+CAPI_GROUP = "cluster.x-k8s.io"
+CAPI_VERSION = "v1beta1"
+
+
+def _kube_api_json(
+    args: List[str], kube_context: Optional[str], kubeconfig: Optional[str]
+) -> Optional[Tuple[int, Union[dict, str]]]:
+    """
+    Serve the `kubectl get ... -o json` shapes used in this module through
+    the Kubernetes Python client. Returns (status, data_or_error), or None
+    for anything else. API errors pass their HTTP status through (404 for a
+    missing object) and connection failures return status 1, as kubectl
+    would, instead of raising.
+    """
+    if len(args) not in (2, 3) or args[0] != "get":
+        return None
+
+    kind, name = args[1], (args[2] if len(args) == 3 else None)
+    if kind not in ("node", "nodes", "machine", "machines"):
+        return None
+
+    try:
+        api = k8s_client.get_api_client(kubeconfig, kube_context)
+        if kind in ("node", "nodes"):
+            v1 = k8s_client.client.CoreV1Api(api)
+            obj = v1.read_node(name) if name else v1.list_node()
+        else:
+            custom = k8s_client.client.CustomObjectsApi(api)
+            namespace = k8s_client.get_default_namespace(kubeconfig, kube_context)
+            if name:
+                return 0, custom.get_namespaced_custom_object(
+                    CAPI_GROUP, CAPI_VERSION, namespace, "machines", name
+                )
+            return 0, custom.list_namespaced_custom_object(
+                CAPI_GROUP, CAPI_VERSION, namespace, "machines"
+            )
+    except k8s_client.config.ConfigException as e:
+        return 1, f"invalid kubeconfig {kubeconfig}: {e}"
+    except k8s_client.client.ApiException as e:
+        return e.status or 1, f"{e.status} {e.reason}: {e.body}"
+    except (_TransportError, OSError) as e:
+        # MaxRetryError, connection refused, DNS failure, ...
+        return 1, f"cannot reach the API server: {e}"
+
+    # camelCase JSON, same shape kubectl prints
+    return 0, api.sanitize_for_serialization(obj)
+
+
+def _kubectl_json_rc(
+    args: List[str], kube_context: Optional[str] = None, kubeconfig: Optional[str] = None
+) -> Tuple[int, Union[dict, str]]:
+    """
+    Run `kubectl <args> -o json` without raising.
+
+    Returns (0, parsed_json) on success, otherwise (status, error_text):
+    the HTTP status from the API client (404 for not found) or kubectl's
+    exit code.
+    """
+    # Prefer the in-process client (no fork/kubectl start-up per query);
+    # DAALU_USE_KUBECTL_BIN forces the old kubectl subprocess path.
+    if k8s_client.client is not None and not os.environ.get("DAALU_USE_KUBECTL_BIN"):
+        res = _kube_api_json(args, kube_context, kubeconfig)
+        if res is not None:
+            return res
 
-def _kubectl_json(args: List[str], kube_context: Optional[str] = None, kubeconfig: Optional[str] = None) -> dict:
     cmd = ["kubectl"]
     if kubeconfig:
         cmd += ["--kubeconfig", kubeconfig]
     if kube_context:
         cmd += ["--context", kube_context]
     cmd += args + ["-o", "json"]
-    cp = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    # Keep stdout as bytes: orjson parses it without a separate decode step
+    cp = subprocess.run(cmd, capture_output=True, text=False, check=False)
     if cp.returncode != 0:
-        raise RuntimeError(cp.stderr)
-    return json.loads(cp.stdout or "{}")
+        return cp.returncode, cp.stderr.decode(errors="replace")
+    if orjson is not None:
+        return 0, orjson.loads(cp.stdout or b"{}")
+    return 0, json.loads(cp.stdout or b"{}")
+
+
+def _kubectl_json(args: List[str], kube_context: Optional[str] = None, kubeconfig: Optional[str] = None) -> dict:
+    rc, data = _kubectl_json_rc(args, kube_context=kube_context, kubeconfig=kubeconfig)
+    if rc != 0:
+        raise RuntimeError(data)
+    return data
+
+
+def _internal_ip(addrs: List[dict]) -> Optional[str]:
+    return next((a.get("address") for a in addrs if a.get("type") == "InternalIP"), None)
 
 
 def get_node_names(workload_kubeconfig: str) -> List[str]:
@@ -46,42 +140,46 @@ def get_node_internal_ip(
 ) -> Optional[str]:
     """
     Retrieve the InternalIP of a Kubernetes Node using `kubectl get node <name> -o json`.
-    Reuses _kubectl_json for execution and optional context/kubeconfig handling.
+    Uses the non-raising _kubectl_json_rc so a missing node is a plain
+    status check rather than exception control flow.
     """
-    log.debug(f"Grabbing node IP for {node_name}")
+    log.debug("Grabbing node IP for %s", node_name)
 
-    try:
-        data = _kubectl_json(
-            ["get", "node", node_name],
-            kubeconfig=kubeconfig,
-        )
-    except RuntimeError as e:
-        log.debug(f"Error fetching node info: {e}")
+    rc, data = _kubectl_json_rc(["get", "node", node_name], kubeconfig=kubeconfig)
+    if rc != 0:
+        log.debug("Error fetching node info (%s): %s", rc, data)
         return None
 
     addrs = data.get("status", {}).get("addresses", [])
-    log.debug(f"Node IP addresses: {addrs}")
+    log.debug("Node IP addresses: %s", addrs)
 
-    for a in addrs:
-        if a.get("type") == "InternalIP":
-            return a.get("address")
-
-    log.debug(f"No InternalIP found for node {node_name}")
-    return None
+    ip = _internal_ip(addrs)
+    if ip is None:
+        log.debug("No InternalIP found for node %s", node_name)
+    return ip
 
 
 def get_machine_internal_ip(mgmt_context: Optional[str], machine_name: str) -> Optional[str]:
     # Machines live on the management cluster; ask for a single Machine by name
     #try:
-    log.debug(f"grabbing machine ip for {machine_name}")
+    log.debug("grabbing machine ip for %s", machine_name)
     data = _kubectl_json(["get", "machines", machine_name])
     #except RuntimeError:        return None
     addrs = data.get("status", {}).get("addresses", [])
-    log.debug(f"machine ip addresses {addrs}")
-    for a in addrs:
-        if a.get("type") == "InternalIP":
-            return a.get("address")
-    return None
+    log.debug("machine ip addresses %s", addrs)
+    return _internal_ip(addrs)
+
+def _get_nodes_with_ips(kubeconfig: Optional[str] = None) -> List[Tuple[str, Optional[str]]]:
+    """
+    Return [(node_name, internal_ip_or_None), ...] from a single
+    `kubectl get nodes -o json` call.
+    """
+    data = _kubectl_json(["get", "nodes"], kubeconfig=kubeconfig)
+    return [
+        (item["metadata"]["name"], _internal_ip(item.get("status", {}).get("addresses", [])))
+        for item in data.get("items", [])
+    ]
+
 
 def build_hosts_entries(
     mgmt_context: Optional[str],
@@ -89,46 +187,96 @@ def build_hosts_entries(
 ) -> List[Tuple[str, str]]:
     """
     Return [(ip, hostname), ...] for each workload node.
-    Resolves IP via `kubectl get node <name> -o json` on the given management context.
+    Resolves names and IPs with one `kubectl get nodes -o json` on the workload cluster.
     """
-    names = get_node_names(workload_kubeconfig)
     out: List[Tuple[str, str]] = []
 
-    for n in names:
-        ip = get_node_internal_ip(
-            node_name=n,
-            kubeconfig=workload_kubeconfig
-        )
+    for n, ip in _get_nodes_with_ips(workload_kubeconfig):
         if ip:
             out.append((ip, n))
+        else:
+            log.debug("No InternalIP found for node %s", n)
 
     log.debug(f"hosts entries is {out}")
     return out
 
+@lru_cache(maxsize=32)
+def _hosts_filter_pattern(
+    hosts: Tuple[str, ...],
+    cleanup_regex: Optional[str],
+) -> Optional[re.Pattern]:
+    """
+    One compiled alternation covering the cleanup pattern and every host
+    about to be (re)written, so the hosts file is filtered in a single pass.
+    Cached because the host set rarely changes between runs in a process.
+    """
+    patterns = [cleanup_regex] if cleanup_regex else []
+    patterns += [_HOST_LINE_TMPL.format(re.escape(h)) for h in hosts]
+    return re.compile("|".join(patterns)) if patterns else None
+
+
 def update_hosts_file(
     entries: List[Tuple[str, str]],
     hosts_file: Path,
     domain_suffix: str,
     cleanup_regex: Optional[str] = None,
 ) -> None:
-    text = hosts_file.read_text() if hosts_file.exists() else ""
-    if cleanup_regex:
-        text = "\n".join([ln for ln in text.splitlines() if not re.search(cleanup_regex, ln)])
+    combined = _hosts_filter_pattern(tuple(host for _, host in entries), cleanup_regex)
 
+    # Last entry wins for a repeated host, as with the old per-entry rewrite
+    new_lines: Dict[str, str] = {}
     for ip, host in entries:
-        fqdn = f"{host}.{domain_suffix}"
-        line = f"{ip} {host} {fqdn}"
-        # remove any existing line for this host
-        text = "\n".join([ln for ln in text.splitlines() if not re.search(rf"\b{re.escape(host)}(\s|$)", ln)])
-        text += ("\n" if text and not text.endswith("\n") else "") + line
-
-    # write safely with sudo
-    with tempfile.NamedTemporaryFile("w", delete=False) as tmp:
-        tmp.write(text + ("\n" if not text.endswith("\n") else ""))
+        new_lines.pop(host, None)
+        new_lines[host] = f"{ip} {host} {host}.{domain_suffix}"
+
+    # Stage next to the target when we may write there, so the update can
+    # be an atomic rename; otherwise stage in /tmp and `sudo cp` it over.
+    writable = os.access(hosts_file.parent, os.W_OK) and (
+        not hosts_file.exists() or os.access(hosts_file, os.W_OK)
+    )
+    with tempfile.NamedTemporaryFile(
+        "w",
+        dir=hosts_file.parent if writable else None,
+        prefix=".daalu-hosts.",
+        delete=False,
+    ) as tmp:
         tmp_path = tmp.name
+        if hosts_file.exists():
+            with open(hosts_file) as src:
+                tmp.writelines(
+                    ln
+                    if ln.endswith("\n") else ln + "\n"
+                    for ln in src
+                    if not (combined and combined.search(ln.rstrip("\r\n")))
+                )
+        tmp.writelines(ln + "\n" for ln in new_lines.values())
+
+    if writable:
+        try:
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, hosts_file)
+            return
+        except OSError as e:
+            # e.g. a bind-mounted /etc/hosts cannot be renamed over
+            log.debug("atomic hosts update failed (%s), falling back to sudo cp", e)
+
+    try:
+        subprocess.run(["sudo", "cp", tmp_path, str(hosts_file)], check=True)
+        subprocess.run(["sudo", "chmod", "644", str(hosts_file)], check=True)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=4)
+def _env_for(templates_dir: str) -> "Environment":
+    from daalu.bootstrap.template_renderer import JINJA_BYTECODE_CACHE_DIR
 
-    subprocess.run(["sudo", "cp", tmp_path, str(hosts_file)], check=True)
-    subprocess.run(["sudo", "chmod", "644", str(hosts_file)], check=True)
+    JINJA_BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_BYTECODE_CACHE_DIR)),
+        auto_reload=False,
+    )
 
 
 def render_inventory_templates(
@@ -140,16 +288,15 @@ def render_inventory_templates(
 ) -> None:
     if Environment is None:
         raise RuntimeError("jinja2 is required for inventory rendering. Add it to requirements if you need this.")
-    env = Environment(loader=FileSystemLoader(str(templates_dir)))
+    env = _env_for(str(templates_dir))
     ctx = {
         "hosts_entries": [{"ip": ip, "hostname": hn} for ip, hn in entries],
     }
-    log.debug(f'ctx is {ctx}')
+    log.debug("ctx is %s", ctx)
     if extra_vars:
         ctx.update(extra_vars)
 
     hosts_tpl = env.get_template("hosts.ini.j2")
     openstack_tpl = env.get_template("openstack_hosts.ini.j2")
     output_hosts_ini.write_text(hosts_tpl.render(**ctx))
-    os_ini = openstack_tpl.render(**ctx)
     output_openstack_hosts_ini.write_text(openstack_tpl.render(**ctx))
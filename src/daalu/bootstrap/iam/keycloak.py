@@ -5,10 +5,15 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import posixpath
 from dataclasses import asdict
 from typing import Optional
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from daalu.bootstrap.shared.keycloak.models import (
     KeycloakIAMConfig,
@@ -16,6 +21,12 @@ from daalu.bootstrap.shared.keycloak.models import (
 )
 
 
+# Existence checks are cheap and should fail fast; realm/client creation
+# can be slow on a freshly started Keycloak.
+GET_TIMEOUT = 5
+WRITE_TIMEOUT = 30
+
+
 class KeycloakIAMError(RuntimeError):
     pass
 
@@ -33,18 +44,53 @@ class KeycloakIAMManager:
     def __init__(self, *, config: KeycloakIAMConfig):
         self.config = config
         self._token: Optional[str] = None
+        self._headers_cached: Optional[dict[str, str]] = None
+
+        base = str(self.config.admin.base_url).rstrip("/")
+        self._admin_url_base = f"{base}/admin/realms"
+
+        # One pooled session for every admin call instead of a new TCP/TLS
+        # connection per request. Gateway errors while Keycloak restarts are
+        # retried with backoff, honouring Retry-After. POST is left out: a
+        # create that timed out after Keycloak committed it would come back
+        # as 409 on retry.
+        self.session = requests.Session()
+        self.session.verify = self.config.admin.verify_tls
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "PUT"]),
+                respect_retry_after_header=True,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     # -----------------------
     # HTTP helpers
     # -----------------------
     def _base_admin_url(self) -> str:
-        base = str(self.config.admin.base_url).rstrip("/")
-        return f"{base}/admin/realms"
+        return self._admin_url_base
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        return self.session.get(url, timeout=GET_TIMEOUT, **kwargs)
+
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        return self.session.post(url, timeout=WRITE_TIMEOUT, **kwargs)
+
+    def _put(self, url: str, **kwargs) -> requests.Response:
+        return self.session.put(url, timeout=WRITE_TIMEOUT, **kwargs)
 
     def _headers(self) -> dict[str, str]:
-        if not self._token:
+        # Requests go through self.session, which already carries the
+        # Authorization header; this is kept for callers building their own.
+        if self._headers_cached is None:
             raise KeycloakIAMError("Not authenticated")
-        return {"Authorization": f"Bearer {self._token}", "Content-Type": "application/json"}
+        return self._headers_cached
 
     def login(self) -> None:
         """
@@ -61,11 +107,21 @@ class KeycloakIAMManager:
             "password": self.config.admin.password,
         }
 
-        r = requests.post(token_url, data=data, verify=self.config.admin.verify_tls, timeout=30)
+        r = self._post(token_url, data=data)
         if r.status_code != 200:
             raise KeycloakIAMError(f"Keycloak login failed: {r.status_code} {r.text}")
 
         self._token = r.json()["access_token"]
+        # Content-Type is left to requests (json= vs the form-encoded login)
+        self.session.headers.update({"Authorization": f"Bearer {self._token}"})
+        self._headers_cached = {
+            "Authorization": f"Bearer {self._token}",
+            "Content-Type": "application/json",
+        }
+
+    def _ensure_logged_in(self) -> None:
+        if not self._token:
+            self.login()
 
     # -----------------------
     # Realm
@@ -74,7 +130,7 @@ class KeycloakIAMManager:
         realm = self.config.realm.realm
         url = f"{self._base_admin_url()}/{realm}"
 
-        r = requests.get(url, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+        r = self._get(url)
         if r.status_code == 200:
             return
         if r.status_code != 404:
@@ -87,7 +143,7 @@ class KeycloakIAMManager:
             "displayName": self.config.realm.display_name,
         }
 
-        r = requests.post(create_url, json=payload, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+        r = self._post(create_url, json=payload)
         if r.status_code not in (201, 204):
             raise KeycloakIAMError(f"Failed to create realm {realm}: {r.status_code} {r.text}")
 
@@ -96,7 +152,7 @@ class KeycloakIAMManager:
     # -----------------------
     def _find_client_uuid(self, *, realm: str, client_id: str) -> Optional[str]:
         url = f"{self._base_admin_url()}/{realm}/clients"
-        r = requests.get(url, params={"clientId": client_id}, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+        r = self._get(url, params={"clientId": client_id})
         if r.status_code != 200:
             raise KeycloakIAMError(f"Failed to query clients: {r.status_code} {r.text}")
 
@@ -134,11 +190,18 @@ class KeycloakIAMManager:
         url = f"{self._base_admin_url()}/{realm}/clients"
         payload = self._build_client_payload(client)
 
-        r = requests.post(url, json=payload, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+        r = self._post(url, json=payload)
         if r.status_code not in (201, 204):
             raise KeycloakIAMError(f"Failed to create client {client.id}: {r.status_code} {r.text}")
 
-        # now it exists
+        # Keycloak answers 201 with Location: .../clients/<uuid>
+        location = r.headers.get("Location")
+        if location:
+            client_uuid = posixpath.basename(urlparse(location).path.rstrip("/"))
+            if client_uuid:
+                return client_uuid
+
+        # Older Keycloak without a Location header: look it up
         client_uuid = self._find_client_uuid(realm=realm, client_id=client.id)
         if not client_uuid:
             raise KeycloakIAMError(f"Created client {client.id} but failed to find it afterwards")
@@ -149,36 +212,50 @@ class KeycloakIAMManager:
         url = f"{self._base_admin_url()}/{realm}/clients/{client_uuid}"
         payload = self._build_client_payload(client)
 
-        r = requests.put(url, json=payload, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+        r = self._put(url, json=payload)
         if r.status_code not in (200, 204):
             raise KeycloakIAMError(f"Failed to update client {client.id}: {r.status_code} {r.text}")
 
-    def ensure_client_roles(self, *, client_uuid: str, roles: list[str]) -> None:
+    def ensure_client_roles(
+        self,
+        *,
+        client_uuid: str,
+        roles: list[str],
+        max_workers: int = 8,
+    ) -> None:
         if not roles:
             return
 
         realm = self.config.realm.realm
-        for role in roles:
-            url = f"{self._base_admin_url()}/{realm}/clients/{client_uuid}/roles/{role}"
-            r = requests.get(url, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+        roles_url = f"{self._base_admin_url()}/{realm}/clients/{client_uuid}/roles"
+
+        def ensure_role(role: str) -> None:
+            r = self._get(f"{roles_url}/{role}")
             if r.status_code == 200:
-                continue
+                return
             if r.status_code != 404:
                 raise KeycloakIAMError(f"Failed to query role {role}: {r.status_code} {r.text}")
 
-            create_url = f"{self._base_admin_url()}/{realm}/clients/{client_uuid}/roles"
-            payload = {"name": role}
-            r = requests.post(create_url, json=payload, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+            r = self._post(roles_url, json={"name": role})
             if r.status_code not in (201, 204):
                 raise KeycloakIAMError(f"Failed to create role {role}: {r.status_code} {r.text}")
 
+        # Roles are independent; check/create them concurrently over the
+        # pooled session and only raise once every request has finished.
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(roles))) as pool:
+            futures = [pool.submit(ensure_role, role) for role in roles]
+
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            raise errors[0]
+
     def get_client_secret(self, *, client_uuid: str) -> str:
         """
         Only valid for confidential clients.
         """
         realm = self.config.realm.realm
         url = f"{self._base_admin_url()}/{realm}/clients/{client_uuid}/client-secret"
-        r = requests.get(url, headers=self._headers(), verify=self.config.admin.verify_tls, timeout=30)
+        r = self._get(url)
         if r.status_code != 200:
             raise KeycloakIAMError(f"Failed to get client secret: {r.status_code} {r.text}")
         return r.json()["value"]
@@ -202,8 +279,8 @@ class KeycloakIAMManager:
         self._ensure_logged_in()
 
         url = (
-            f"{self.admin.base_url.rstrip('/')}"
-            f"/admin/realms/{realm}/authentication/required-actions/{alias}"
+            f"{self._base_admin_url()}/{realm}"
+            f"/authentication/required-actions/{alias}"
         )
 
         payload = {
@@ -214,7 +291,7 @@ class KeycloakIAMManager:
             "defaultAction": default_action,
         }
 
-        r = self.session.put(url, json=payload, verify=self.admin.verify_tls)
+        r = self._put(url, json=payload)
 
         # Keycloak returns:
         # - 204 if updated
@@ -226,11 +303,11 @@ class KeycloakIAMManager:
         if r.status_code == 404:
             # Create if missing
             create_url = (
-                f"{self.admin.base_url.rstrip('/')}"
-                f"/admin/realms/{realm}/authentication/required-actions"
+                f"{self._base_admin_url()}/{realm}"
+                f"/authentication/required-actions"
             )
 
-            r = self.session.post(create_url, json=payload, verify=self.admin.verify_tls)
+            r = self._post(create_url, json=payload)
             r.raise_for_status()
             return
 
@@ -7,16 +7,19 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
 
 from daalu.bootstrap.engine.component import InfraComponent
+from daalu.utils.yaml_fast import safe_load
 import logging
 
 log = logging.getLogger("daalu")
 
+CERT_MANAGER_API_VERSION = "cert-manager.io/v1"
+
 
 @dataclass(frozen=True)
 class CertManagerIssuer:
@@ -94,16 +97,21 @@ class CertManagerComponent(InfraComponent):
 
         # cert-manager typically runs multiple pods
         self.min_running_pods = 2
+        self._values: Optional[dict] = None
 
     def values(self) -> dict:
-        return self.load_values_file(self.values_path)
+        # Parsed once per component; later calls reuse the same dict
+        if self._values is None:
+            self._values = self.load_values_file(self.values_path)
+        return self._values
 
     # -------------------------
     # Config loading
     # -------------------------
 
     def _load_config(self) -> CertManagerConfig:
-        raw = yaml.safe_load(self.config_path.read_text()) or {}
+        with self.config_path.open("rb") as f:
+            raw = safe_load(f) or {}
 
         cloudflare = raw.get("cloudflare", {}) or {}
         token_from_file = (cloudflare.get("api_token") or "").strip()
@@ -184,6 +192,21 @@ class CertManagerComponent(InfraComponent):
             "stringData": {"api-token": token},
         }
 
+    def _cloudflare_solvers(self, *, dns_zones: List[str]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "dns01": {
+                    "cloudflare": {
+                        "apiTokenSecretRef": {
+                            "name": "cloudflare-api-token-secret",
+                            "key": "api-token",
+                        }
+                    }
+                },
+                "selector": {"dnsZones": dns_zones},
+            }
+        ]
+
     def _cluster_issuer(
         self,
         *,
@@ -191,9 +214,14 @@ class CertManagerComponent(InfraComponent):
         server: str,
         email: str,
         dns_zones: List[str],
+        solvers: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
+        # Callers building many issuers pass one shared solvers list; the
+        # documents are only dumped, never mutated, so sharing is safe.
+        if solvers is None:
+            solvers = self._cloudflare_solvers(dns_zones=dns_zones)
         return {
-            "apiVersion": "cert-manager.io/v1",
+            "apiVersion": CERT_MANAGER_API_VERSION,
             "kind": "ClusterIssuer",
             "metadata": {"name": name},
             "spec": {
@@ -204,19 +232,7 @@ class CertManagerComponent(InfraComponent):
                         "name": name,
                         "key": "tls.key",
                     },
-                    "solvers": [
-                        {
-                            "dns01": {
-                                "cloudflare": {
-                                    "apiTokenSecretRef": {
-                                        "name": "cloudflare-api-token-secret",
-                                        "key": "api-token",
-                                    }
-                                }
-                            },
-                            "selector": {"dnsZones": dns_zones},
-                        }
-                    ],
+                    "solvers": solvers,
                 }
             },
         }
@@ -226,7 +242,7 @@ class CertManagerComponent(InfraComponent):
 
     def _certificate(self, cert: CertManagerCertificate) -> Dict[str, Any]:
         return {
-            "apiVersion": "cert-manager.io/v1",
+            "apiVersion": CERT_MANAGER_API_VERSION,
             "kind": "Certificate",
             "metadata": {"name": cert.name, "namespace": cert.namespace},
             "spec": {
@@ -236,10 +252,6 @@ class CertManagerComponent(InfraComponent):
             },
         }
 
-    def _dump_multi(self, objs: List[Dict[str, Any]]) -> str:
-        # YAML multi-doc output
-        return "\n---\n".join(yaml.safe_dump(o, sort_keys=False) for o in objs if o)
-
     # -------------------------
     # Hooks
     # -------------------------
@@ -248,42 +260,34 @@ class CertManagerComponent(InfraComponent):
         cfg = self._load_config()
 
         # 1) Cloudflare token secret (cert-manager namespace)
-        kubectl.apply_content(
-            content=self._dump_multi([self._cloudflare_secret(token=cfg.cloudflare_api_token)]),
-            remote_path="/tmp/cert-manager-cloudflare-secret.yaml",
-        )
+        secret_doc = self._cloudflare_secret(token=cfg.cloudflare_api_token)
 
-        # 2) ClusterIssuers
-        issuer_docs = [
+        # 2) ClusterIssuers (all share one Cloudflare DNS-01 solver)
+        solvers = self._cloudflare_solvers(dns_zones=cfg.dns_zones)
+        issuer_docs = (
             self._cluster_issuer(
                 name=i.name,
                 server=i.server,
                 email=cfg.email,
                 dns_zones=cfg.dns_zones,
+                solvers=solvers,
             )
             for i in cfg.cluster_issuers
-        ]
-        kubectl.apply_content(
-            content=self._dump_multi(issuer_docs),
-            remote_path="/tmp/cert-manager-cluster-issuers.yaml",
         )
 
-        # 3) Ensure namespaces for certificates exist
+        # 3) Namespaces for certificates
         ns_names = sorted({c.namespace for c in cfg.certificates if c.namespace})
-        ns_docs = [self._namespace(n) for n in ns_names]
-        if ns_docs:
-            kubectl.apply_content(
-                content=self._dump_multi(ns_docs),
-                remote_path="/tmp/cert-manager-namespaces.yaml",
-            )
+        ns_docs = (self._namespace(n) for n in ns_names)
 
         # 4) Certificates
-        cert_docs = [self._certificate(c) for c in cfg.certificates]
-        if cert_docs:
-            kubectl.apply_content(
-                content=self._dump_multi(cert_docs),
-                remote_path="/tmp/cert-manager-certificates.yaml",
-            )
+        cert_docs = (self._certificate(c) for c in cfg.certificates)
+
+        # One upload + one `kubectl apply`; objects are applied in order,
+        # so namespaces exist before the certificates that live in them.
+        kubectl.apply_objects(
+            chain((secret_doc,), issuer_docs, ns_docs, cert_docs),
+            remote_path="/tmp/cert-manager-bootstrap.json",
+        )
 
         # 5) Optional: Argo CD onboarding (kept, but off by default)
         if cfg.argocd_onboard.enabled:
@@ -303,7 +307,9 @@ class CertManagerComponent(InfraComponent):
 
         if onboard.local_manifest:
             path = self.assets_dir / onboard.local_manifest
-            if not path.exists():
+            # Single local stat; apply_file hands the path to kubectl over
+            # SSH and never opens it here, so there is no second check.
+            if not path.is_file():
                 raise RuntimeError(f"ArgoCD onboard manifest not found: {path}")
             kubectl.apply_file(path)
             return
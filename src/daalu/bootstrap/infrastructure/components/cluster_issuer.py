@@ -3,11 +3,12 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional
-import yaml
 
 from daalu.bootstrap.engine.component import InfraComponent
+from daalu.utils.yaml_fast import safe_load
 
 
 @dataclass
@@ -57,11 +58,17 @@ class ClusterIssuerComponent(InfraComponent):
 
         self.config_path = config_path
         self.wait_for_pods = False
-        self.cfg = self._load_config()
 
     # --------------------------------------------------
+    @cached_property
+    def cfg(self) -> ClusterIssuerConfig:
+        # Parsed on first use so components that are only constructed
+        # (registry listing, validation, dry runs) never read the file.
+        return self._load_config()
+
     def _load_config(self) -> ClusterIssuerConfig:
-        raw = yaml.safe_load(self.config_path.read_text()) or {}
+        with self.config_path.open("rb") as f:
+            raw = safe_load(f) or {}
 
         issuer_type = raw["issuer_type"]
         name = raw["name"]
@@ -109,28 +116,31 @@ class ClusterIssuerComponent(InfraComponent):
     def post_install(self, kubectl) -> None:
         cfg = self.cfg
 
-        # Always ensure bootstrap self-signed issuer exists
-        kubectl.apply_objects([{
+        # Always ensure bootstrap self-signed issuer exists; it goes out in
+        # the same apply as the configured issuer (one upload + kubectl run).
+        objects = [{
             "apiVersion": "cert-manager.io/v1",
             "kind": "ClusterIssuer",
             "metadata": {"name": "self-signed"},
             "spec": {"selfSigned": {}},
-        }])
+        }]
 
         if cfg.issuer_type == "self-signed":
-            self._apply_self_signed(kubectl)
+            objects.extend(self._build_self_signed())
         elif cfg.issuer_type == "ca":
-            self._apply_ca(kubectl)
+            objects.extend(self._build_ca())
         elif cfg.issuer_type == "acme":
-            self._apply_acme(kubectl)
+            objects.extend(self._build_acme())
         elif cfg.issuer_type == "venafi":
-            self._apply_venafi(kubectl)
+            objects.extend(self._build_venafi())
         else:
             raise ValueError(f"Unknown issuer_type: {cfg.issuer_type}")
 
+        kubectl.apply_objects(objects)
+
     # --------------------------------------------------
-    def _apply_self_signed(self, kubectl):
-        kubectl.apply_objects([
+    def _build_self_signed(self) -> List[dict]:
+        return [
             {
                 "apiVersion": "cert-manager.io/v1",
                 "kind": "Certificate",
@@ -152,10 +162,10 @@ class ClusterIssuerComponent(InfraComponent):
                 "metadata": {"name": self.cfg.name},
                 "spec": {"ca": {"secretName": self.cfg.self_signed_secret_name}},
             },
-        ])
+        ]
 
-    def _apply_ca(self, kubectl):
-        kubectl.apply_objects([
+    def _build_ca(self) -> List[dict]:
+        return [
             {
                 "apiVersion": "v1",
                 "kind": "Secret",
@@ -175,12 +185,12 @@ class ClusterIssuerComponent(InfraComponent):
                 "metadata": {"name": self.cfg.name},
                 "spec": {"ca": {"secretName": self.cfg.ca_secret_name}},
             },
-        ])
+        ]
 
-    def _apply_acme(self, kubectl):
+    def _build_acme(self) -> List[dict]:
         solvers = [{s.type: s.config} for s in self.cfg.acme_solvers or []]
 
-        kubectl.apply_objects([{
+        return [{
             "apiVersion": "cert-manager.io/v1",
             "kind": "ClusterIssuer",
             "metadata": {"name": self.cfg.name},
@@ -194,12 +204,12 @@ class ClusterIssuerComponent(InfraComponent):
                     "solvers": solvers,
                 }
             },
-        }])
+        }]
 
-    def _apply_venafi(self, kubectl):
-        kubectl.apply_objects([{
+    def _build_venafi(self) -> List[dict]:
+        return [{
             "apiVersion": "cert-manager.io/v1",
             "kind": "ClusterIssuer",
             "metadata": {"name": self.cfg.name},
             "spec": {"venafi": self.cfg.venafi_spec},
-        }])
+        }]
@@ -43,9 +43,13 @@ class IngressNginxComponent(InfraComponent):
         self.assets_dir = assets_dir
         self.github_token = github_token
         self.wait_for_pods = True
+        self._values: Optional[dict] = None
 
     def values(self) -> dict:
-        return self.load_values_file(self.values_path)
+        # Parsed once per component; later calls reuse the same dict
+        if self._values is None:
+            self._values = self.load_values_file(self.values_path)
+        return self._values
 
     # ------------------------------------------------------------------
     # Argo CD onboarding (post Helm bootstrap)
@@ -3,11 +3,16 @@
 
 # src/daalu/bootstrap/infrastructure/components/istio/argocd.py
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import urllib.request
+from typing import Optional
+
+import requests
 
 from daalu.bootstrap.engine.component import InfraComponent
 
+MAX_MANIFEST_BYTES = 2 * 1024 * 1024
+
 
 class IstioArgoCDComponent(InfraComponent):
     def __init__(
@@ -39,6 +44,12 @@ class IstioArgoCDComponent(InfraComponent):
         self.apps = apps
         self.wait_for_pods = False
         self.enable_argocd = True
+        self.max_download_workers = 8
+        self._gh_headers = {
+            "Accept": "application/vnd.github.v3.raw",
+            "Authorization": f"token {self.github_token}",
+            "User-Agent": "daalu-cli",
+        }
 
     # --------------------------------------------------
     def post_install(self, kubectl) -> None:
@@ -48,26 +59,50 @@ class IstioArgoCDComponent(InfraComponent):
             namespace="argocd",
         )
 
-        for name, path in self.apps.items():
-            if name.lower() in [e.lower() for e in existing]:
-                continue
+        existing_lc = {e.lower() for e in existing}
+        pending = [
+            path
+            for name, path in self.apps.items()
+            if name.lower() not in existing_lc
+        ]
+        if not pending:
+            return
+
+        # Downloads are independent network round trips, so overlap them
+        # over one pooled session; manifests are still applied in order.
+        with self._github_session() as session, ThreadPoolExecutor(
+            max_workers=min(self.max_download_workers, len(pending))
+        ) as pool:
+            manifests = list(
+                pool.map(lambda p: self._download_manifest(p, session=session), pending)
+            )
 
-            manifest = self._download_manifest(path)
+        for manifest in manifests:
             kubectl.apply_yaml(manifest)
 
-    def _download_manifest(self, path: str) -> str:
+    def _github_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self._gh_headers)
+        return session
+
+    def _download_manifest(self, path: str, session: Optional[requests.Session] = None) -> str:
         url = (
             f"https://api.github.com/repos/"
             f"{self.repo_owner}/{self.repo_name}/contents/{path}"
         )
-        req = urllib.request.Request(
-            url,
-            headers={
-                "Accept": "application/vnd.github.v3.raw",
-                "Authorization": f"token {self.github_token}",
-                "User-Agent": "daalu-cli",
-            },
-        )
+        if session is None:
+            with self._github_session() as own:
+                return self._download_manifest(path, session=own)
 
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return resp.read().decode("utf-8")
+        # Stream the body and stop at MAX_MANIFEST_BYTES so a runaway
+        # response cannot grow memory without bound.
+        with session.get(url, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            buf = bytearray()
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                buf += chunk
+                if len(buf) > MAX_MANIFEST_BYTES:
+                    raise RuntimeError(
+                        f"Manifest {path} exceeds {MAX_MANIFEST_BYTES} bytes"
+                    )
+        return buf.decode("utf-8")
@@ -71,11 +71,7 @@ def build_istio_components(
     # --------------------------------------------------
     # 3) Traffic objects (Gateway / VS / DR)
     # --------------------------------------------------
-    traffic_cfg = infra_asset_path(
-        workspace_root,
-        component="istio",
-        filename="traffic.yaml",
-    )
+    traffic_cfg = istio_assets_dir / "traffic.yaml"
     if traffic_cfg.exists():
         components.append(
             IstioTrafficComponent(
@@ -4,25 +4,27 @@
 # src/daalu/bootstrap/infrastructure/components/istio/models.py
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Tuple
 
 
 # -----------------------------
 # Gateway
 # -----------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IstioGatewayTLS:
     mode: str
     credentialName: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IstioGatewayConfig:
     name: str
     namespace: str
-    selector: Dict[str, str]
+    # Dict fields stay mutable for the manifest builders and are left out
+    # of the generated __hash__ (they still take part in ==).
+    selector: Dict[str, str] = field(hash=False)
     tls: IstioGatewayTLS
     http_redirect_port_80_to_443: bool = True
 
@@ -31,33 +33,44 @@ class IstioGatewayConfig:
 # Service / Traffic
 # -----------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IstioServiceConfig:
     name: str
     port: int
     subset: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IstioDestinationRuleConfig:
-    trafficPolicy: Dict
+    trafficPolicy: Dict = field(hash=False)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IstioApplication:
     name: str
-    hostnames: List[str]
+    hostnames: Tuple[str, ...]
     traffic_namespace: str
     original_svc_namespace: str
     gateway: IstioGatewayConfig
     service: IstioServiceConfig
     destinationrule: IstioDestinationRuleConfig
 
+    # Cluster-local FQDN of the backing Service, derived once at construction
+    fqdn: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # frozen: bypass the generated __setattr__
+        object.__setattr__(
+            self,
+            "fqdn",
+            f"{self.service.name}.{self.original_svc_namespace}.svc.cluster.local",
+        )
+
 
 # -----------------------------
 # Root config
 # -----------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IstioTrafficConfig:
-    applications: List[IstioApplication]
+    applications: Tuple[IstioApplication, ...]
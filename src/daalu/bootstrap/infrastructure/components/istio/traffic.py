@@ -4,9 +4,9 @@
 # src/daalu/bootstrap/infrastructure/components/istio/traffic.py
 
 from pathlib import Path
-import yaml
 
 from daalu.bootstrap.engine.component import InfraComponent
+from daalu.utils.yaml_cache import load_yaml_file
 from .models import (
     IstioTrafficConfig,
     IstioApplication,
@@ -16,6 +16,20 @@ from .models import (
     IstioDestinationRuleConfig,
 )
 
+_GATEWAY_HOSTS = ("*.daalu.io", "daalu.io")
+
+# Gateway server blocks that are the same for every app. They are shared
+# between the built objects, which are only serialized, never mutated.
+_HTTP_REDIRECT_SERVER = {
+    "port": {"number": 80, "name": "http", "protocol": "HTTP"},
+    "hosts": list(_GATEWAY_HOSTS),
+    "tls": {"httpsRedirect": True},
+}
+_HTTPS_SERVER_BASE = {
+    "port": {"number": 443, "name": "https", "protocol": "HTTPS"},
+    "hosts": list(_GATEWAY_HOSTS),
+}
+
 
 class IstioTrafficComponent(InfraComponent):
     def __init__(self, *, config_path: Path, kubeconfig: str):
@@ -41,7 +55,7 @@ class IstioTrafficComponent(InfraComponent):
 
     # --------------------------------------------------
     def _load_config(self) -> IstioTrafficConfig:
-        raw = yaml.safe_load(self.config_path.read_text())
+        raw = load_yaml_file(self.config_path)
 
         apps = []
         for a in raw["applications"]:
@@ -58,7 +72,7 @@ class IstioTrafficComponent(InfraComponent):
 
             app = IstioApplication(
                 name=a["name"],
-                hostnames=a["hostnames"],
+                hostnames=tuple(a["hostnames"]),
                 traffic_namespace=a["traffic_namespace"],
                 original_svc_namespace=a["original_svc_namespace"],
                 gateway=gateway,
@@ -69,117 +83,101 @@ class IstioTrafficComponent(InfraComponent):
             )
             apps.append(app)
 
-        return IstioTrafficConfig(applications=apps)
+        return IstioTrafficConfig(applications=tuple(apps))
 
     # --------------------------------------------------
     def post_install(self, kubectl) -> None:
-        for app in self.cfg.applications:
-            self._ensure_namespace(kubectl, app)
-            self._ensure_gateway(kubectl, app)
-            self._ensure_destination_rule(kubectl, app)
-            self._ensure_virtual_service(kubectl, app)
+        apps = self.cfg.applications
+
+        # One apply for every app. Kinds are grouped so all Namespaces are
+        # created before the Gateways/DestinationRules/VirtualServices in them.
+        namespaces = {app.traffic_namespace: self._build_namespace(app) for app in apps}
+        objects: list[dict] = list(namespaces.values())
+        objects.extend(self._build_gateway(app) for app in apps)
+        objects.extend(self._build_destination_rule(app) for app in apps)
+        objects.extend(self._build_virtual_service(app) for app in apps)
+
+        kubectl.apply_objects(objects)
 
     # --------------------------------------------------
-    def _ensure_namespace(self, kubectl, app: IstioApplication):
-        kubectl.apply_objects([
-            {
-                "apiVersion": "v1",
-                "kind": "Namespace",
-                "metadata": {"name": app.traffic_namespace},
-            }
-        ])
-
-    def _ensure_gateway(self, kubectl, app: IstioApplication):
+    def _build_namespace(self, app: IstioApplication) -> dict:
+        return {
+            "apiVersion": "v1",
+            "kind": "Namespace",
+            "metadata": {"name": app.traffic_namespace},
+        }
+
+    def _build_gateway(self, app: IstioApplication) -> dict:
         gw = app.gateway
-        kubectl.apply_objects([
-            {
-                "apiVersion": "networking.istio.io/v1beta1",
-                "kind": "Gateway",
-                "metadata": {
-                    "name": gw.name,
-                    "namespace": gw.namespace,
-                },
-                "spec": {
-                    "selector": gw.selector,
-                    "servers": [
-                        {
-                            "port": {
-                                "number": 80,
-                                "name": "http",
-                                "protocol": "HTTP",
-                            },
-                            "hosts": ["*.daalu.io", "daalu.io"],
-                            "tls": {"httpsRedirect": True},
-                        },
-                        {
-                            "port": {
-                                "number": 443,
-                                "name": "https",
-                                "protocol": "HTTPS",
-                            },
-                            "hosts": ["*.daalu.io", "daalu.io"],
-                            "tls": {
-                                "mode": gw.tls.mode,
-                                "credentialName": gw.tls.credentialName,
-                            },
+        return {
+            "apiVersion": "networking.istio.io/v1beta1",
+            "kind": "Gateway",
+            "metadata": {
+                "name": gw.name,
+                "namespace": gw.namespace,
+            },
+            "spec": {
+                "selector": gw.selector,
+                "servers": [
+                    _HTTP_REDIRECT_SERVER,
+                    {
+                        **_HTTPS_SERVER_BASE,
+                        "tls": {
+                            "mode": gw.tls.mode,
+                            "credentialName": gw.tls.credentialName,
                         },
-                    ],
-                },
-            }
-        ])
+                    },
+                ],
+            },
+        }
 
-    def _ensure_destination_rule(self, kubectl, app: IstioApplication):
-        subsets = []
-        if app.service.subset:
-            subsets.append({
-                "name": app.service.subset,
-                "labels": {"version": app.service.subset},
-            })
-
-        kubectl.apply_objects([
-            {
-                "apiVersion": "networking.istio.io/v1beta1",
-                "kind": "DestinationRule",
-                "metadata": {
-                    "name": f"{app.name}-dr",
-                    "namespace": app.traffic_namespace,
-                },
-                "spec": {
-                    "host": f"{app.service.name}.{app.original_svc_namespace}.svc.cluster.local",
-                    "trafficPolicy": app.destinationrule.trafficPolicy,
-                    "subsets": subsets,
-                },
-            }
-        ])
-
-    def _ensure_virtual_service(self, kubectl, app: IstioApplication):
+    def _build_destination_rule(self, app: IstioApplication) -> dict:
+        subset = app.service.subset
+        # Empty tuple for the common no-subset case; serialized as []
+        subsets = (
+            [{"name": subset, "labels": {"version": subset}}] if subset else ()
+        )
+
+        return {
+            "apiVersion": "networking.istio.io/v1beta1",
+            "kind": "DestinationRule",
+            "metadata": {
+                "name": f"{app.name}-dr",
+                "namespace": app.traffic_namespace,
+            },
+            "spec": {
+                "host": app.fqdn,
+                "trafficPolicy": app.destinationrule.trafficPolicy,
+                "subsets": subsets,
+            },
+        }
+
+    def _build_virtual_service(self, app: IstioApplication) -> dict:
         destination = {
-            "host": f"{app.service.name}.{app.original_svc_namespace}.svc.cluster.local",
+            "host": app.fqdn,
             "port": {"number": app.service.port},
         }
 
         if app.service.subset:
             destination["subset"] = app.service.subset
 
-        kubectl.apply_objects([
-            {
-                "apiVersion": "networking.istio.io/v1beta1",
-                "kind": "VirtualService",
-                "metadata": {
-                    "name": f"{app.name}-vs",
-                    "namespace": app.traffic_namespace,
-                },
-                "spec": {
-                    "hosts": app.hostnames,
-                    "gateways": [
-                        f"{app.gateway.namespace}/{app.gateway.name}"
-                    ],
-                    "http": [
-                        {
-                            "match": [{"uri": {"prefix": "/"}}],
-                            "route": [{"destination": destination}],
-                        }
-                    ],
-                },
-            }
-        ])
+        return {
+            "apiVersion": "networking.istio.io/v1beta1",
+            "kind": "VirtualService",
+            "metadata": {
+                "name": f"{app.name}-vs",
+                "namespace": app.traffic_namespace,
+            },
+            "spec": {
+                "hosts": app.hostnames,
+                "gateways": [
+                    f"{app.gateway.namespace}/{app.gateway.name}"
+                ],
+                "http": [
+                    {
+                        "match": [{"uri": {"prefix": "/"}}],
+                        "route": [{"destination": destination}],
+                    }
+                ],
+            },
+        }
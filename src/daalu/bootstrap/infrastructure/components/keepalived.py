@@ -5,32 +5,62 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import json
-import yaml
+import os
+import tempfile
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+try:
+    import orjson
+except ImportError:  # optional; falls back to stdlib json
+    orjson = None
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
 
 from daalu.bootstrap.engine.component import InfraComponent
+from daalu.bootstrap.template_renderer import JINJA_BYTECODE_CACHE_DIR
 from daalu.utils.helpers import wait_for_node_interface_ipv4
+from daalu.utils.yaml_cache import load_yaml_file
 import logging
 
 log = logging.getLogger("daalu")
 
+_REQUIRED_KEEPALIVED_KEYS = (
+    "keepalived_password",
+    "keepalived_vip",
+    "keepalived_interface",
+    "dep_check_image",
+    "keepalived_image",
+)
+
+
+def _tojson(v: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(v).decode()
+    return json.dumps(v)
 
+
+@lru_cache(maxsize=16)
 def _render_jinja_dir(*, root: Path) -> Environment:
+    # One Environment per assets dir for the whole process: its template
+    # cache keeps parsed templates, and the bytecode cache lets later runs
+    # skip compiling them from source.
+    JINJA_BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     env = Environment(
         loader=FileSystemLoader(str(root)),
         undefined=StrictUndefined,
         autoescape=False,
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_BYTECODE_CACHE_DIR)),
     )
 
     # Needed for manifests.yaml.j2
-    env.filters["tojson"] = lambda v: json.dumps(v)
+    env.filters["tojson"] = _tojson
     env.filters["indent"] = lambda s, n=2: "\n".join((" " * n + line) for line in str(s).splitlines())
 
     return env
@@ -70,27 +100,24 @@ class KeepalivedComponent(InfraComponent):
         self.wait_for_pods = True
         self.min_running_pods = 1
 
-        self._values: Dict[str, Any] = yaml.safe_load(self.values_path.read_text()) or {}
+        self._values: Dict[str, Any] = load_yaml_file(self.values_path) or {}
         self._jinja = _render_jinja_dir(root=self.assets_dir)
         self.enable_argocd = False
 
-    def _required(self, key: str) -> Any:
-        v = self._values.get(key)
-        if v in (None, "", []):
-            raise ValueError(f"[keepalived] Missing required '{key}' in {self.values_path}")
-        return v
-
     def pre_install(self, kubectl) -> None:
         if not self._values.get("keepalived_enabled", True):
             log.debug("[keepalived] Disabled, skipping")
             return
 
-        # Required config
-        self._required("keepalived_password")
-        self._required("keepalived_vip")
-        self._required("keepalived_interface")
-        self._required("dep_check_image")
-        self._required("keepalived_image")
+        # Required config, reported all at once
+        missing = [
+            k for k in _REQUIRED_KEEPALIVED_KEYS
+            if self._values.get(k) in (None, "", [])
+        ]
+        if missing:
+            raise ValueError(
+                f"[keepalived] Missing required keys {missing} in {self.values_path}"
+            )
 
         backend = self._values.get("network_backend", "ovn")
         dep_map = self._values.get("keepalived_pod_dependency") or {}
@@ -105,24 +132,25 @@ class KeepalivedComponent(InfraComponent):
             **self._values
         )
 
-        # Render full manifests
-        manifests = self._jinja.get_template("manifests.yaml.j2").render(
+        # Stream the full manifests straight into a temp file and upload
+        # that, rather than building the whole bundle as one string.
+        stream = self._jinja.get_template("manifests.yaml.j2").stream(
             namespace=self.namespace,
             keepalived_conf=keepalived_conf,
             dependency_pod_json=dependency,
             **self._values,
         )
-
-        # Apply (your kubectl wrapper should support applying raw YAML)
-        # If you don't have apply_yaml, use apply_file with a temp file.
-        kubectl.apply_content(content=manifests, remote_path="/tmp/keepalived.yaml")
+        with tempfile.NamedTemporaryFile(
+            "wb", prefix="daalu-keepalived-", suffix=".yaml", delete=False
+        ) as tmp:
+            stream.dump(tmp, encoding="utf-8")
+        try:
+            kubectl.apply_local_file(tmp.name, remote_path="/tmp/keepalived.yaml")
+        finally:
+            os.unlink(tmp.name)
 
         # Replace the old wait-for-ip initContainer with a Daalu-level wait
         wait_cfg = self._values.get("wait_for_interface_ipv4", {}) or {}
 
-
-        # Basic sanity
-        kubectl.run(["get", "ds", "keepalived", "-n", self.namespace])
-
     def helm_values(self) -> Dict[str, Any]:
         return self._values
@@ -9,17 +9,41 @@ from pathlib import Path
 from typing import Dict
 
 import time
-import yaml
+import bcrypt
 import pymysql
+from pymysql.converters import escape_string
 import os
+import re
 import base64
+import socket
 
 
 from daalu.bootstrap.engine.component import InfraComponent
+from daalu.k8s import client as k8s_client
+from daalu.utils.yaml_cache import load_yaml_file
 import logging
 
 log = logging.getLogger("daalu")
 
+_SQL_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _sql_identifier(name: str) -> str:
+    # DDL identifiers cannot be bound as query parameters
+    if not _SQL_IDENTIFIER.fullmatch(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def _tcp_reachable(host: str, port: int, timeout: float = 1.0) -> bool:
+    # Cheap routability probe: ClusterIPs are usually not reachable from the
+    # bootstrap host, and we don't want to sit out a MySQL connect timeout.
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
 
 class KeycloakComponent(InfraComponent):
     """
@@ -29,6 +53,12 @@ class KeycloakComponent(InfraComponent):
 
     ADMIN_SECRET_NAME = "keycloak-admin-credentials"
 
+    ADMIN_BCRYPT_SECRET_NAME = "keycloak-admin-bcrypt"
+
+    # Image for the admin password reset Job; it only needs a mysql client
+    # since the bcrypt hash is computed by daalu itself.
+    PW_RESET_IMAGE = "mysql:8.0"
+
     def __init__(
         self,
         *,
@@ -36,6 +66,8 @@ class KeycloakComponent(InfraComponent):
         kubeconfig: str,
         namespace: str = "auth-system",
         admin_password: str = "",
+        pw_reset_image: str = "",
+        direct_db_bootstrap: bool = False,
     ):
         super().__init__(
             name="keycloak",
@@ -55,13 +87,24 @@ class KeycloakComponent(InfraComponent):
         self.wait_for_pods = True
         self.min_running_pods = 1
 
-        self._values: Dict = yaml.safe_load(values_path.read_text()) or {}
+        self._values: Dict = load_yaml_file(values_path) or {}
 
         # DB config (explicit, not magic)
         self.db_name = "keycloak"
         self.db_user = "keycloak"
         self.db_password = os.environ.get("DAALU_KEYCLOAK_DB_PASSWORD", "")
         self.admin_password = admin_password or os.environ.get("DAALU_KEYCLOAK_ADMIN_PASSWORD", "")
+        # The DB bootstrap SQL runs from an in-cluster Job by default. Hosts
+        # that can route to the PXC service ClusterIP may opt into running it
+        # directly over pymysql instead.
+        self.direct_db_bootstrap = direct_db_bootstrap or (
+            os.environ.get("DAALU_KEYCLOAK_DIRECT_DB_BOOTSTRAP", "") == "1"
+        )
+        self.pw_reset_image = (
+            pw_reset_image
+            or os.environ.get("DAALU_KEYCLOAK_PW_RESET_IMAGE", "")
+            or self.PW_RESET_IMAGE
+        )
         self.enable_argocd = False
 
     # ------------------------------------------------------------------
@@ -75,6 +118,19 @@ class KeycloakComponent(InfraComponent):
         return svc["spec"]["clusterIP"]
 
     def _get_mysql_root_password(self, kubectl) -> str:
+        # Read the secret over the API when the kubeconfig is local: no
+        # kubectl start-up, and the HTTPS connection is pooled.
+        api = self.core_v1_api()
+        if api is not None:
+            try:
+                secret = api.read_namespaced_secret("percona-xtradb", "openstack")
+            except k8s_client.client.ApiException as e:
+                raise RuntimeError(f"Failed to read MySQL root password: {e.reason}") from e
+            root = (secret.data or {}).get("root")
+            if not root:
+                raise RuntimeError("Failed to read MySQL root password: key 'root' missing")
+            return base64.b64decode(root).decode()
+
         rc, out, err = kubectl.run(
             [
                 "get",
@@ -97,63 +153,212 @@ class KeycloakComponent(InfraComponent):
         return os.environ.get("DAALU_MYSQL_ROOT_PASSWORD", "")
 
     # ------------------------------------------------------------------
-    def _wait_for_mysql(self, host: str) -> None:
-        for _ in range(120):
+    def _wait_for_mysql(
+        self,
+        host: str,
+        timeout: float = 600.0,
+        *,
+        password: str | None = None,
+    ) -> None:
+        # Back off from 0.5s up to 10s between probes: fast when MySQL is
+        # already up, far fewer handshakes while it is still starting.
+        if password is None:
+            password = self._get_mysql_root_password_env()
+        delay = 0.5
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             try:
                 conn = pymysql.connect(
                     host=host,
                     user="root",
-                    password=self._get_mysql_root_password_env(),
-                    connect_timeout=5,
+                    password=password,
+                    connect_timeout=2,
                 )
                 conn.close()
                 return
-            except Exception:
-                time.sleep(5)
+            except pymysql.err.OperationalError as e:
+                log.debug("MySQL at %s not ready yet: %s", host, e)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 10.0)
         raise RuntimeError("MySQL never became ready")
 
+    # ------------------------------------------------------------------
+    def _wait_job_complete(self, kubectl, job_name: str, namespace: str, timeout: int) -> None:
+        """
+        Block until a Job completes.
+
+        With a local kubeconfig this is one watch stream on the Job instead
+        of a `kubectl wait` process; otherwise falls back to kubectl.
+        """
+        api = self.batch_v1_api()
+        if api is None:
+            kubectl.run(
+                [
+                    "wait", "--for=condition=complete",
+                    f"job/{job_name}", "-n", namespace,
+                    f"--timeout={timeout}s",
+                ]
+            )
+            return
+
+        w = k8s_client.watch.Watch()
+        try:
+            for event in w.stream(
+                api.list_namespaced_job,
+                namespace=namespace,
+                field_selector=f"metadata.name={job_name}",
+                timeout_seconds=timeout,
+            ):
+                for cond in event["object"].status.conditions or []:
+                    if cond.status != "True":
+                        continue
+                    if cond.type == "Complete":
+                        return
+                    if cond.type == "Failed":
+                        raise RuntimeError(
+                            f"Job {namespace}/{job_name} failed: {cond.message or cond.reason}"
+                        )
+        finally:
+            w.stop()
+
+        raise RuntimeError(f"Job {namespace}/{job_name} did not complete within {timeout}s")
+
     # ------------------------------------------------------------------
     def pre_install(self, kubectl) -> None:
         log.debug("Running keycloak pre-install steps...")
-        log.debug("Bootstrapping database via Kubernetes Job...")
 
-        job_name = "keycloak-mysql-bootstrap"
         pxc_ns = "openstack"
         auth_ns = self.namespace  # expected to be "auth-system"
 
         # ------------------------------------------------------------------
-        # Ensure auth-system namespace exists (idempotent)
+        # Namespace + Secrets in one apply, before any Job runs
         # ------------------------------------------------------------------
-        log.debug(f"Ensuring namespace '{auth_ns}' exists...")
-
-        kubectl.apply_objects(
-            [
+        log.debug(f"Ensuring namespace '{auth_ns}' and secrets exist...")
+
+        static_objects = [
+            {
+                "apiVersion": "v1",
+                "kind": "Namespace",
+                "metadata": {
+                    "name": auth_ns,
+                },
+            },
+            # Secret for Keycloak DB password
+            {
+                "apiVersion": "v1",
+                "kind": "Secret",
+                "metadata": {
+                    "name": "keycloak-externaldb",
+                    "namespace": self.namespace,
+                },
+                "type": "Opaque",
+                "stringData": {
+                    "db-password": self.db_password,
+                    "db-username": self.db_user,
+                },
+            },
+        ]
+        if self.admin_password:
+            # Admin credentials for the Helm chart (existingSecret) and the
+            # pre-hashed copy read by the DB reset job in openstack.
+            static_objects.append(
                 {
                     "apiVersion": "v1",
-                    "kind": "Namespace",
+                    "kind": "Secret",
                     "metadata": {
-                        "name": auth_ns,
+                        "name": self.ADMIN_SECRET_NAME,
+                        "namespace": auth_ns,
+                    },
+                    "type": "Opaque",
+                    "stringData": {
+                        "admin-password": self.admin_password,
                     },
                 }
-            ]
-        )
+            )
+            static_objects.append(self._admin_bcrypt_secret(pxc_ns))
+
+        kubectl.apply_objects(static_objects)
+
+        if not (self.direct_db_bootstrap and self._bootstrap_db_direct(kubectl)):
+            self._bootstrap_db_job(kubectl)
+
+        if self.admin_password:
+            # Reset admin password in the DB so it matches the secret
+            # (KC_BOOTSTRAP_ADMIN_PASSWORD only works on first boot)
+            self._reset_admin_password_in_db(kubectl)
+
+    # ------------------------------------------------------------------
+    def _bootstrap_db_direct(self, kubectl) -> bool:
+        """
+        Ensure the Keycloak database and user over a direct pymysql
+        connection to the PXC HAProxy service.
+
+        Returns False (so the caller falls back to the Job) when the
+        service port is not reachable from this host.
+        """
+        host = self._get_pxc_service_ip(kubectl)
+        if not _tcp_reachable(host, 3306):
+            log.debug("PXC at %s not reachable from this host; using a Job", host)
+            return False
+
+        password = self._get_mysql_root_password(kubectl)
+        self._wait_for_mysql(host, password=password)
+        try:
+            conn = pymysql.connect(
+                host=host,
+                user="root",
+                password=password,
+                connect_timeout=5,
+                autocommit=True,
+            )
+        except pymysql.err.OperationalError as e:
+            log.debug("PXC at %s not reachable directly (%s); using a Job", host, e)
+            return False
+
+        log.debug("Bootstrapping database directly via %s...", host)
+        db_name = _sql_identifier(self.db_name)
+        with conn, conn.cursor() as cur:
+            cur.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}`")
+            cur.execute(
+                "CREATE USER IF NOT EXISTS %s@'%%' IDENTIFIED BY %s",
+                (self.db_user, self.db_password),
+            )
+            cur.execute(
+                "ALTER USER %s@'%%' IDENTIFIED BY %s",
+                (self.db_user, self.db_password),
+            )
+            cur.execute(
+                f"GRANT ALL PRIVILEGES ON `{db_name}`.* TO %s@'%%'",
+                (self.db_user,),
+            )
+            cur.execute("SET GLOBAL pxc_strict_mode='PERMISSIVE'")
 
-        kubectl.run(["get", "namespace", auth_ns])
-        log.debug(f" Namespace '{auth_ns}' is present")
+        log.debug("✅ Database and user ensured")
+        return True
 
+    def _bootstrap_db_job(self, kubectl) -> None:
+        log.debug("Bootstrapping database via Kubernetes Job...")
 
+        job_name = "keycloak-mysql-bootstrap"
+        pxc_ns = "openstack"
+
+        db_name = _sql_identifier(self.db_name)
+        db_user = _sql_identifier(self.db_user)
+        # Identifiers are validated above; the password is the only free
+        # text and goes in as an escaped string literal.
+        db_password = escape_string(self.db_password)
         sql = f"""
-    CREATE DATABASE IF NOT EXISTS {self.db_name};
+    CREATE DATABASE IF NOT EXISTS `{db_name}`;
 
-    CREATE USER IF NOT EXISTS '{self.db_user}'@'%' IDENTIFIED BY '{self.db_password}';
-    ALTER USER '{self.db_user}'@'%' IDENTIFIED BY '{self.db_password}';
+    CREATE USER IF NOT EXISTS '{db_user}'@'%' IDENTIFIED BY '{db_password}';
+    ALTER USER '{db_user}'@'%' IDENTIFIED BY '{db_password}';
 
-    GRANT ALL PRIVILEGES ON {self.db_name}.* TO '{self.db_user}'@'%';
+    GRANT ALL PRIVILEGES ON `{db_name}`.* TO '{db_user}'@'%';
     SET GLOBAL pxc_strict_mode='PERMISSIVE';
 
-    SHOW DATABASES LIKE '{self.db_name}';
-    SELECT user, host FROM mysql.user WHERE user='{self.db_user}';
-    SHOW GRANTS FOR '{self.db_user}'@'%';
+    SHOW DATABASES LIKE '{db_name}';
+    SELECT user, host FROM mysql.user WHERE user='{db_user}';
+    SHOW GRANTS FOR '{db_user}'@'%';
     """.strip()
 
         job = {
@@ -182,13 +387,15 @@ class KeycloakComponent(InfraComponent):
                                                 "key": "root",
                                             }
                                         },
-                                    }
+                                    },
+                                    # Passed verbatim; no shell quoting layer
+                                    {"name": "BOOTSTRAP_SQL", "value": sql},
                                 ],
                                 "command": ["/bin/bash", "-lc"],
                                 "args": [
                                     (
                                         "set -euo pipefail\n"
-                                        'printf "%s\\n" "' + sql.replace('"', '\\"') + '" | '
+                                        'printf "%s\\n" "$BOOTSTRAP_SQL" | '
                                         "mysql "
                                         "-h percona-xtradb-haproxy.openstack.svc.cluster.local "
                                         "-P 3306 "
@@ -214,16 +421,7 @@ class KeycloakComponent(InfraComponent):
         # ------------------------------------------------------------------
         # Wait for completion (single attempt only)
         # ------------------------------------------------------------------
-        kubectl.run(
-            [
-                "wait",
-                "--for=condition=complete",
-                f"job/{job_name}",
-                "-n",
-                pxc_ns,
-                "--timeout=300s",
-            ]
-        )
+        self._wait_job_complete(kubectl, job_name, pxc_ns, timeout=300)
 
         # ------------------------------------------------------------------
         # Fetch logs (authoritative verification)
@@ -240,70 +438,20 @@ class KeycloakComponent(InfraComponent):
         log.debug(out.strip())
         log.debug("✅ Database and user ensured")
 
-        # ------------------------------------------------------------------
-        # Secret for Keycloak DB password
-        # ------------------------------------------------------------------
-        log.debug(
-            f"Creating/ensuring secret 'keycloak-externaldb' "
-            f"in namespace '{self.namespace}'..."
-        )
-
-        kubectl.apply_objects(
-            [
-                {
-                    "apiVersion": "v1",
-                    "kind": "Secret",
-                    "metadata": {
-                        "name": "keycloak-externaldb",
-                        "namespace": self.namespace,
-                    },
-                    "type": "Opaque",
-                    "stringData": {
-                        "db-password": self.db_password,
-                        "db-username": self.db_user,
-                    },
-                }
-            ]
-        )
-
-        kubectl.run(
-            ["get", "secret", "keycloak-externaldb", "-n", self.namespace]
-        )
-
-        log.debug("✅ Secret 'keycloak-externaldb' is present and ready")
-
-        # ------------------------------------------------------------------
-        # Admin credentials secret (used via existingSecret in Helm values)
-        # ------------------------------------------------------------------
-        if self.admin_password:
-            # Create secret in auth-system (for Keycloak Helm chart)
-            # AND in openstack (for the DB reset job which runs there)
-            for ns in [self.namespace, "openstack"]:
-                log.debug(
-                    f"Creating/ensuring secret '{self.ADMIN_SECRET_NAME}' "
-                    f"in namespace '{ns}'..."
-                )
-                kubectl.apply_objects(
-                    [
-                        {
-                            "apiVersion": "v1",
-                            "kind": "Secret",
-                            "metadata": {
-                                "name": self.ADMIN_SECRET_NAME,
-                                "namespace": ns,
-                            },
-                            "type": "Opaque",
-                            "stringData": {
-                                "admin-password": self.admin_password,
-                            },
-                        }
-                    ]
-                )
-            log.debug(f"✅ Secret '{self.ADMIN_SECRET_NAME}' is present")
-
-            # Reset admin password in the DB so it matches the secret
-            # (KC_BOOTSTRAP_ADMIN_PASSWORD only works on first boot)
-            self._reset_admin_password_in_db(kubectl)
+    def _admin_bcrypt_secret(self, namespace: str) -> Dict:
+        hashed = bcrypt.hashpw(
+            self.admin_password.encode(), bcrypt.gensalt(rounds=12)
+        ).decode()
+        return {
+            "apiVersion": "v1",
+            "kind": "Secret",
+            "metadata": {
+                "name": self.ADMIN_BCRYPT_SECRET_NAME,
+                "namespace": namespace,
+            },
+            "type": "Opaque",
+            "stringData": {"hash": hashed},
+        }
 
     def _reset_admin_password_in_db(self, kubectl) -> None:
         """
@@ -314,8 +462,10 @@ class KeycloakComponent(InfraComponent):
         doesn't exist yet. For existing databases we must directly
         insert/update the user and credential rows via SQL.
 
-        We use a Python 3 container (which has bcrypt-compatible
-        hashlib/crypt) to generate the hash and run the SQL.
+        The bcrypt hash is computed by daalu (see _admin_bcrypt_secret,
+        applied in pre_install) and handed to a plain mysql Job through a
+        Secret, so the pod never sees the plaintext password and needs no
+        Python or package installs.
         """
         import uuid
 
@@ -325,25 +475,10 @@ class KeycloakComponent(InfraComponent):
         cred_id = str(uuid.uuid4())
         user_id = str(uuid.uuid4())
 
-        # Use Python image with mysql client to hash the password and run SQL
-        # The password is injected via env var from the K8s secret
+        # The bcrypt hash is injected via env var from the K8s secret
         script = r"""
 set -euo pipefail
 
-# Install mysql client and bcrypt
-apt-get update -qq && apt-get install -yqq default-mysql-client > /dev/null 2>&1
-pip install -q bcrypt 2>/dev/null
-
-# Generate bcrypt hash
-BCRYPT_HASH=$(python3 -c "
-import bcrypt, os
-pw = os.environ['ADMIN_PASSWORD'].encode()
-hashed = bcrypt.hashpw(pw, bcrypt.gensalt(rounds=12)).decode()
-print(hashed)
-")
-
-echo "Generated bcrypt hash successfully"
-
 MYSQL_CMD="mysql -h percona-xtradb-haproxy.openstack.svc.cluster.local -P 3306 -u root -D keycloak -N -B"
 
 echo "=== Ensuring admin user in keycloak DB ==="
@@ -371,9 +506,6 @@ fi
 echo "Deleting old credentials..."
 $MYSQL_CMD -e "DELETE FROM CREDENTIAL WHERE USER_ID='$ADMIN_ID'"
 
-# Escape the hash for SQL ($ signs)
-ESCAPED_HASH=$(echo "$BCRYPT_HASH" | sed 's/\$/\\$/g')
-
 echo "Inserting new credential..."
 CRED_ID='""" + cred_id + r"""'
 $MYSQL_CMD -e "INSERT INTO CREDENTIAL (ID, TYPE, USER_ID, CREATED_DATE, SECRET_DATA, CREDENTIAL_DATA, PRIORITY) VALUES ('$CRED_ID', 'password', '$ADMIN_ID', UNIX_TIMESTAMP() * 1000, CONCAT('{\"value\":\"', '$BCRYPT_HASH', '\",\"salt\":\"\"}'), '{\"hashIterations\":1,\"algorithm\":\"bcrypt\"}', 10)"
@@ -397,7 +529,7 @@ echo "DONE — admin password reset in DB"
                         "containers": [
                             {
                                 "name": "keycloak-pw-reset",
-                                "image": "python:3.11-slim",
+                                "image": self.pw_reset_image,
                                 "env": [
                                     {
                                         "name": "MYSQL_PWD",
@@ -409,11 +541,11 @@ echo "DONE — admin password reset in DB"
                                         },
                                     },
                                     {
-                                        "name": "ADMIN_PASSWORD",
+                                        "name": "BCRYPT_HASH",
                                         "valueFrom": {
                                             "secretKeyRef": {
-                                                "name": self.ADMIN_SECRET_NAME,
-                                                "key": "admin-password",
+                                                "name": self.ADMIN_BCRYPT_SECRET_NAME,
+                                                "key": "hash",
                                             }
                                         },
                                     },
@@ -430,13 +562,7 @@ echo "DONE — admin password reset in DB"
             ["delete", "job", job_name, "-n", pxc_ns, "--ignore-not-found=true"]
         )
         kubectl.apply_objects([job])
-        kubectl.run(
-            [
-                "wait", "--for=condition=complete",
-                f"job/{job_name}", "-n", pxc_ns,
-                "--timeout=120s",
-            ]
-        )
+        self._wait_job_complete(kubectl, job_name, pxc_ns, timeout=120)
         log.debug("✅ Admin credentials cleared from DB — will be re-created on pod restart")
 
     # ------------------------------------------------------------------
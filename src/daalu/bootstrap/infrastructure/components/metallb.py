@@ -1,7 +1,6 @@
 # Copyright 2026 Kezie Iwueke
 # SPDX-License-Identifier: Apache-2.0
 
-import time
 from pathlib import Path
 from daalu.bootstrap.engine.component import InfraComponent
 import logging
@@ -52,29 +51,10 @@ class MetalLBComponent(InfraComponent):
         # controller after the Helm chart is installed.  Wait until the API
         # server knows about them before applying the pool config.
         log.debug("[metallb] Waiting for MetalLB CRDs to be registered...")
-        for attempt in range(1, 31):
-            rc, _, _ = kubectl._run(
-                "api-resources --api-group=metallb.io -o name"
-            )
-            if rc == 0:
-                _, out, _ = kubectl._run(
-                    "api-resources --api-group=metallb.io -o name"
-                )
-                if "ipaddresspools" in out:
-                    log.debug("[metallb] CRDs ready.")
-                    break
-            log.debug(
-                f"[metallb] CRDs not yet available, retrying "
-                f"({attempt}/30)..."
-            )
-            time.sleep(10)
-        else:
-            raise RuntimeError(
-                "Timed out waiting for MetalLB CRDs (ipaddresspools.metallb.io)"
-            )
+        kubectl.watch_crd("ipaddresspools.metallb.io")
+        log.debug("[metallb] CRDs ready.")
 
-        content = self.metallb_config_path.read_text()
-        kubectl.apply_content(
-            content=content,
+        kubectl.apply_local_file(
+            self.metallb_config_path,
             remote_path="/tmp/metallb-config.yaml",
         )
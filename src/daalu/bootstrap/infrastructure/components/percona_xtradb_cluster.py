@@ -10,14 +10,36 @@ import string
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from daalu.bootstrap.engine.component import InfraComponent
+from daalu.utils.yaml_cache import load_yaml_file
+
+
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits
+# Largest multiple of len(alphabet) that fits in a byte; bytes at or above
+# it are dropped so `b % 62` stays uniform.
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(_PASSWORD_ALPHABET)
+
+_PXC_SECRET_KEYS = (
+    "clustercheck",
+    "monitor",
+    "operator",
+    "proxyadmin",
+    "replication",
+    "root",
+    "xtrabackup",
+)
 
 
 def _gen_password(length: int = 32) -> str:
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    chars: list[str] = []
+    while len(chars) < length:
+        # One urandom read per batch instead of one per character.
+        chars.extend(
+            _PASSWORD_ALPHABET[b % len(_PASSWORD_ALPHABET)]
+            for b in secrets.token_bytes(length * 2)
+            if b < _PASSWORD_BYTE_LIMIT
+        )
+    return "".join(chars[:length])
 
 
 class PerconaXtraDBClusterComponent(InfraComponent):
@@ -51,7 +73,7 @@ class PerconaXtraDBClusterComponent(InfraComponent):
 
         self._values: Dict = {}
 
-        raw = yaml.safe_load(spec_path.read_text())
+        raw = load_yaml_file(spec_path)
 
         if not raw:
             raise ValueError(
@@ -59,61 +81,21 @@ class PerconaXtraDBClusterComponent(InfraComponent):
                 "You must define _percona_xtradb_cluster_spec."
             )
 
-        if "_percona_xtradb_cluster_spec" not in raw:
+        if not isinstance(raw, dict) or "_percona_xtradb_cluster_spec" not in raw:
             raise ValueError(
                 f"{spec_path} must contain a top-level "
                 "'_percona_xtradb_cluster_spec' key."
             )
 
         self.cluster_spec = raw["_percona_xtradb_cluster_spec"]
+        if not isinstance(self.cluster_spec, dict):
+            raise ValueError(
+                f"_percona_xtradb_cluster_spec in {spec_path} must be a "
+                f"mapping, got {type(self.cluster_spec).__name__}."
+            )
 
-
-    # ------------------------------------------------------------------
-    def pre_install(self, kubectl) -> None:
-        """
-        Create secret if it doesn't exist (exact Ansible parity).
-        """
-        secret_name = self.cluster_spec.get("secretsName", "percona-xtradb")
-
-        try:
-            if kubectl.get(
-                api_version="v1",
-                kind="Secret",
-                name=secret_name,
-                namespace=self.namespace,
-            ):
-                return
-        except RuntimeError:
-            pass  # Secret doesn't exist yet — create it below
-
-        kubectl.apply_objects([
-            {
-                "apiVersion": "v1",
-                "kind": "Secret",
-                "metadata": {
-                    "name": secret_name,
-                    "namespace": self.namespace,
-                },
-                "type": "Opaque",
-                "stringData": {
-                    "clustercheck": _gen_password(),
-                    "monitor": _gen_password(),
-                    "operator": _gen_password(),
-                    "proxyadmin": _gen_password(),
-                    "replication": _gen_password(),
-                    "root": _gen_password(),
-                    "xtrabackup": _gen_password(),
-                },
-            }
-        ])
-
-    # ------------------------------------------------------------------
-    def post_install(self, kubectl) -> None:
-        """
-        Apply PerconaXtraDBCluster CR and HAProxy metrics service.
-        """
-
-        kubectl.apply_objects([
+        # Nothing here changes between deploys, so build it once.
+        self._post_install_objects = [
             {
                 "apiVersion": "pxc.percona.com/v1",
                 "kind": "PerconaXtraDBCluster",
@@ -122,11 +104,8 @@ class PerconaXtraDBClusterComponent(InfraComponent):
                     "namespace": self.namespace,
                 },
                 "spec": self.cluster_spec,
-            }
-        ])
-
-        # HAProxy metrics service
-        kubectl.apply_objects([
+            },
+            # HAProxy metrics service
             {
                 "apiVersion": "v1",
                 "kind": "Service",
@@ -153,4 +132,37 @@ class PerconaXtraDBClusterComponent(InfraComponent):
                     },
                 },
             }
+        ]
+
+
+    # ------------------------------------------------------------------
+    def pre_install(self, kubectl) -> None:
+        """
+        Create secret if it doesn't exist (exact Ansible parity).
+
+        The Secret is created rather than applied: if it already exists
+        create_objects leaves it alone, so credentials already in use are
+        never overwritten and no separate existence check is needed.
+        """
+        secret_name = self.cluster_spec.get("secretsName", "percona-xtradb")
+
+        kubectl.create_objects([
+            {
+                "apiVersion": "v1",
+                "kind": "Secret",
+                "metadata": {
+                    "name": secret_name,
+                    "namespace": self.namespace,
+                },
+                "type": "Opaque",
+                "stringData": {key: _gen_password() for key in _PXC_SECRET_KEYS},
+            }
         ])
+
+    # ------------------------------------------------------------------
+    def post_install(self, kubectl) -> None:
+        """
+        Apply PerconaXtraDBCluster CR and HAProxy metrics service.
+        """
+
+        kubectl.apply_objects(self._post_install_objects)
@@ -32,46 +32,57 @@ class InfrastructureManager:
         infra_logger = InfraJsonlLogger()
         infra_logger.log_event("infra.manager.start", components=[c.name for c in components])
 
-        # ---- Wrap SSH so every command/transfer is captured ----
-        # Host label is optional; if your SSHRunner knows the hostname, you can pass it in.
-        logged_ssh = LoggedSSHRunner(self.ssh, infra_logger)
-
-        # IMPORTANT: ensure HelmCliRunner uses the wrapped SSH too
-        # (since helm commands run through helm.ssh.run)
-        if getattr(self.helm, "ssh", None) is self.ssh:
-            self.helm.ssh = logged_ssh
-
-        # ---- Stage kubeconfig ONCE on controller ----
-        kubeconfig_path = components[0].kubeconfig
-        kubeconfig_text = Path(kubeconfig_path).read_text()
-
-        infra_logger.set_stage("kubeconfig.stage")
-        logged_ssh.put_text(
-            kubeconfig_text,
-            kubeconfig_path,
-            sudo=True,
-        )
-
-        engine = HelmInfraEngine(
-            helm=self.helm,
-            ssh=logged_ssh,
-            logger=infra_logger,  # new. for logging functionality.
-        )
-
-        for component in components:
-            infra_logger.set_component(component.name)
-            infra_logger.set_stage("component.deploy")
-            infra_logger.log_event("infra.component.start", component=component.name)
-
-            try:
-                engine.deploy(component)
-                infra_logger.log_event("infra.component.success", component=component.name)
-            except Exception as e:
-                infra_logger.log_event("infra.component.failed", component=component.name, error=str(e))
-                raise
-
-        infra_logger.set_stage("infra.complete")
-        infra_logger.log_event("infra.manager.success")
+        helm_ssh = getattr(self.helm, "ssh", None)
+        try:
+            # ---- Wrap SSH so every command/transfer is captured ----
+            # Host label is optional; if your SSHRunner knows the hostname, you can pass it in.
+            logged_ssh = LoggedSSHRunner(self.ssh, infra_logger)
+
+            # IMPORTANT: ensure HelmCliRunner uses the wrapped SSH too
+            # (since helm commands run through helm.ssh.run)
+            if helm_ssh is self.ssh:
+                self.helm.ssh = logged_ssh
+
+            # ---- Stage kubeconfig ONCE on controller ----
+            kubeconfig_path = components[0].kubeconfig
+            kubeconfig_text = Path(kubeconfig_path).read_text()
+
+            infra_logger.set_stage("kubeconfig.stage")
+            logged_ssh.put_text(
+                kubeconfig_text,
+                kubeconfig_path,
+                sudo=True,
+            )
+
+            engine = HelmInfraEngine(
+                helm=self.helm,
+                ssh=logged_ssh,
+                logger=infra_logger,  # new. for logging functionality.
+            )
+            engine.load_deployed_releases(components)
+            engine.add_repos(components)
+
+            for component in components:
+                infra_logger.set_component(component.name)
+                infra_logger.set_stage("component.deploy")
+                infra_logger.log_event("infra.component.start", component=component.name)
+
+                try:
+                    engine.deploy(component)
+                    infra_logger.log_event("infra.component.success", component=component.name)
+                except Exception as e:
+                    infra_logger.log_event("infra.component.failed", component=component.name, error=str(e))
+                    raise
+
+            infra_logger.set_stage("infra.complete")
+            infra_logger.log_event("infra.manager.success")
+        finally:
+            # The helm runner is shared with later deploy phases; give it back
+            # its own SSH runner before the run log is closed.
+            if helm_ssh is self.ssh:
+                self.helm.ssh = helm_ssh
+            # Flush buffered events even when a component fails
+            infra_logger.close()
 
 
     def pre_install(self, kubectl):
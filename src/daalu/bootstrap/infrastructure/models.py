@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Set
+from typing import FrozenSet, Optional
 
 
 @dataclass(frozen=True)
@@ -13,7 +13,7 @@ class InfraSelection:
     """
     Represents which infrastructure components the user wants.
     """
-    components: Optional[Set[str]]  # None = all
+    components: Optional[FrozenSet[str]]  # None = all
 
 
 def parse_infra_flag(infra: Optional[str]) -> InfraSelection:
@@ -28,7 +28,7 @@ def parse_infra_flag(infra: Optional[str]) -> InfraSelection:
     if infra is None or infra == "all":
         return InfraSelection(components=None)
 
-    parts = {p.strip().lower() for p in infra.split(",") if p.strip()}
+    parts = frozenset(filter(None, (p.strip().lower() for p in infra.split(","))))
     if not parts:
         return InfraSelection(components=None)
 
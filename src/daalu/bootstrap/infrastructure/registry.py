@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable
 
 from daalu.bootstrap.infrastructure.models import InfraSelection
 from daalu.bootstrap.engine.component import InfraComponent
@@ -41,200 +41,168 @@ from daalu.bootstrap.infrastructure.components.keepalived import (
 )
 
 
+def _asset(workspace_root: Path, component: str, filename: str = "") -> Path:
+    return infra_asset_path(workspace_root, component=component, filename=filename)
 
-def build_infrastructure_components(
-    *,
-    selection: InfraSelection,
-    workspace_root: Path,
-    kubeconfig_path: str,
-    keycloak_admin_password: str = "",
-) -> list[InfraComponent]:
-    components: list[InfraComponent] = []
 
-    if selection.components is None or "metallb" in selection.components:
-        components.append(
-            MetalLBComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="metallb",
-                    filename="values.yaml",
-                ),
-                metallb_config_path=infra_asset_path(
-                    workspace_root,
-                    component="metallb",
-                    filename="config.yaml",
-                ),
-                kubeconfig=kubeconfig_path,
-            )
-        )
-    if selection.components is None or "argocd" in selection.components:
-        components.append(
-            ArgoCDComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="argocd",
-                    filename="values.yaml",
-                ),
-                kubeconfig=kubeconfig_path
-            )
+# Each factory takes (workspace_root, kubeconfig_path, keycloak_admin_password)
+# and returns the components for one --infra name.
+_Factory = Callable[[Path, str, str], Iterable[InfraComponent]]
+
+
+def _metallb(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        MetalLBComponent(
+            values_path=_asset(root, "metallb", "values.yaml"),
+            metallb_config_path=_asset(root, "metallb", "config.yaml"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
 
-    if selection.components is None or "cert-manager" in selection.components:
-        components.append(
-            CertManagerComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="cert-manager",
-                    filename="values.yaml",
-                ),
-                config_path=infra_asset_path(
-                    workspace_root,
-                    component="cert-manager",
-                    filename="config.yaml",
-                ),
-                assets_dir=infra_asset_path(
-                    workspace_root,
-                    component="cert-manager",
-                    filename="",
-                ),
-                kubeconfig=kubeconfig_path,
-            )
+def _argocd(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        ArgoCDComponent(
+            values_path=_asset(root, "argocd", "values.yaml"),
+            kubeconfig=kubeconfig,
         )
-        
-    if selection.components is None or "cluster-issuer" in selection.components:
-        components.append(
-            ClusterIssuerComponent(
-                config_path=infra_asset_path(
-                    workspace_root,
-                    component="cluster_issuer",
-                    filename="config.yaml",
-                ),
-                kubeconfig=kubeconfig_path,
-            )
+    ]
+
+
+def _cert_manager(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        CertManagerComponent(
+            values_path=_asset(root, "cert-manager", "values.yaml"),
+            config_path=_asset(root, "cert-manager", "config.yaml"),
+            assets_dir=_asset(root, "cert-manager"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if selection.components is None or "istio" in selection.components:
-        components.extend(
-            build_istio_components(
-                workspace_root=workspace_root,
-                kubeconfig_path=kubeconfig_path,
-            )
+
+def _cluster_issuer(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        ClusterIssuerComponent(
+            config_path=_asset(root, "cluster_issuer", "config.yaml"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if selection.components is None or "ingress-nginx" in selection.components:
-        components.append(
-            IngressNginxComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="ingress-nginx",
-                    filename="values.yaml",
-                ),
-                assets_dir=infra_asset_path(
-                    workspace_root,
-                    component="ingress-nginx",
-                    filename="",
-                ),
-                kubeconfig=kubeconfig_path,
-                #github_token=selection.github_token,
-            )
+
+def _istio(root: Path, kubeconfig: str, _kc_password: str):
+    return build_istio_components(
+        workspace_root=root,
+        kubeconfig_path=kubeconfig,
+    )
+
+
+def _ingress_nginx(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        IngressNginxComponent(
+            values_path=_asset(root, "ingress-nginx", "values.yaml"),
+            assets_dir=_asset(root, "ingress-nginx"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if (
-        selection.components is None
-        or "rabbitmq-cluster-operator" in selection.components
-    ):
-        components.append(
-            RabbitMQClusterOperatorComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="rabbitmq-cluster-operator",
-                    filename="values.yaml",
-                ),
-                assets_dir=infra_asset_path(
-                    workspace_root,
-                    component="rabbitmq-cluster-operator",
-                    filename="",
-                ),
-                kubeconfig=kubeconfig_path,
-                #github_token=selection.github_token,
-            )
+
+def _rabbitmq_cluster_operator(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        RabbitMQClusterOperatorComponent(
+            values_path=_asset(root, "rabbitmq-cluster-operator", "values.yaml"),
+            assets_dir=_asset(root, "rabbitmq-cluster-operator"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if selection.components is None or "pxc-operator" in selection.components:
-        components.append(
-            PerconaXtraDBClusterOperatorComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="pxc-operator",
-                    filename="values.yaml",
-                ),
-                assets_dir=infra_asset_path(
-                    workspace_root,
-                    component="pxc-operator",
-                    filename="",
-                ),
-                kubeconfig=kubeconfig_path,
-                #github_token=selection.github_token,
-            )
+
+def _pxc_operator(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        PerconaXtraDBClusterOperatorComponent(
+            values_path=_asset(root, "pxc-operator", "values.yaml"),
+            assets_dir=_asset(root, "pxc-operator"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if selection.components is None or "percona-xtradb-cluster" in selection.components:
-        components.append(
-            PerconaXtraDBClusterComponent(
-                spec_path=infra_asset_path(
-                    workspace_root,
-                    component="percona-xtradb-cluster",
-                    filename="spec.yaml",
-                ),
-                kubeconfig=kubeconfig_path,
-            )
+
+def _percona_xtradb_cluster(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        PerconaXtraDBClusterComponent(
+            spec_path=_asset(root, "percona-xtradb-cluster", "spec.yaml"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if selection.components is None or "kubernetes-node-labels" in selection.components:
-        components.append(
-            KubernetesNodeLabelsComponent(
-                workspace_root=workspace_root,
-                kubeconfig=kubeconfig_path,
-            )
+
+def _kubernetes_node_labels(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        KubernetesNodeLabelsComponent(
+            workspace_root=root,
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if selection.components is None or "valkey" in selection.components:
-        components.append(
-            ValkeyComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="valkey",
-                    filename="values.yaml",
-                ),
-                kubeconfig=kubeconfig_path,
-            )
+
+def _valkey(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        ValkeyComponent(
+            values_path=_asset(root, "valkey", "values.yaml"),
+            kubeconfig=kubeconfig,
         )
+    ]
 
-    if selection.components is None or "keycloak" in selection.components:
-        components.append(
-            KeycloakComponent(
-                values_path=infra_asset_path(
-                    workspace_root,
-                    component="keycloak",
-                    filename="values.yaml",
-                ),
-                kubeconfig=kubeconfig_path,
-                admin_password=keycloak_admin_password,
-            )
+
+def _keycloak(root: Path, kubeconfig: str, kc_password: str):
+    return [
+        KeycloakComponent(
+            values_path=_asset(root, "keycloak", "values.yaml"),
+            kubeconfig=kubeconfig,
+            admin_password=kc_password,
         )
+    ]
 
-    if selection.components is None or "keepalived" in selection.components:
-        components.append(
-            KeepalivedComponent(
-                assets_dir=infra_asset_path(
-                    workspace_root,
-                    component="keepalived",
-                    filename="",
-                ),
-                kubeconfig=kubeconfig_path,
-            )
+
+def _keepalived(root: Path, kubeconfig: str, _kc_password: str):
+    return [
+        KeepalivedComponent(
+            assets_dir=_asset(root, "keepalived"),
+            kubeconfig=kubeconfig,
         )
+    ]
+
+
+# --infra name -> factory, in deploy order.
+_INFRA_COMPONENT_FACTORIES: tuple[tuple[str, _Factory], ...] = (
+    ("metallb", _metallb),
+    ("argocd", _argocd),
+    ("cert-manager", _cert_manager),
+    ("cluster-issuer", _cluster_issuer),
+    ("istio", _istio),
+    ("ingress-nginx", _ingress_nginx),
+    ("rabbitmq-cluster-operator", _rabbitmq_cluster_operator),
+    ("pxc-operator", _pxc_operator),
+    ("percona-xtradb-cluster", _percona_xtradb_cluster),
+    ("kubernetes-node-labels", _kubernetes_node_labels),
+    ("valkey", _valkey),
+    ("keycloak", _keycloak),
+    ("keepalived", _keepalived),
+)
+
 
+def build_infrastructure_components(
+    *,
+    selection: InfraSelection,
+    workspace_root: Path,
+    kubeconfig_path: str,
+    keycloak_admin_password: str = "",
+) -> list[InfraComponent]:
+    wanted = selection.components
 
+    components: list[InfraComponent] = []
+    for name, factory in _INFRA_COMPONENT_FACTORIES:
+        if wanted is None or name in wanted:
+            components.extend(
+                factory(workspace_root, kubeconfig_path, keycloak_admin_password)
+            )
     return components
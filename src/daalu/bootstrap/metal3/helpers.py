@@ -19,6 +19,42 @@ from daalu.utils.helpers import kubectl, clusterctl
 log = logging.getLogger("daalu")
 
 
+def _kubectl_wait(
+    runner: CommandRunner,
+    kubectl_args: list[str],
+    *,
+    timeout_seconds: float,
+    retry_delay: int = 5,
+) -> bool:
+    """
+    Run `kubectl <kubectl_args> --timeout=...` (a `kubectl wait`) until it
+    succeeds or `timeout_seconds` runs out; returns whether it succeeded.
+
+    kubectl wait returns as soon as the API server reports the condition,
+    but fails straight away while the target does not exist yet, so those
+    failures (and API server hiccups) are retried after `retry_delay`.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        remaining = int(deadline - time.monotonic())
+        if remaining <= 0:
+            return False
+
+        result = runner.run(
+            ["kubectl", *kubectl_args, f"--timeout={remaining}s"],
+            capture_output=True,
+            check=False,
+        )
+        if result.returncode == 0:
+            return True
+
+        log.debug(
+            "kubectl wait not satisfied yet: %s",
+            (result.stderr or result.stdout or "").strip(),
+        )
+        time.sleep(min(retry_delay, max(deadline - time.monotonic(), 0)))
+
+
 def fetch_cluster_kubeconfig(
     *,
     cluster_name: str,
@@ -87,8 +123,9 @@ def wait_for_pods_running(
     )
 
     selector = ["--all-namespaces"] if namespace is None else ["-n", namespace]
+    deadline = time.monotonic() + retries * delay
 
-    for _ in range(retries):
+    while time.monotonic() < deadline:
         result = runner.run(
             [
                 "kubectl",
@@ -97,18 +134,51 @@ def wait_for_pods_running(
                 "get",
                 "pods",
                 *selector,
+                # Completed (Succeeded) pods never turn Running; skip them
                 "--field-selector",
-                "status.phase!=Running",
-                "--no-headers",
+                "status.phase!=Running,status.phase!=Succeeded",
+                "-o",
+                "jsonpath={range .items[*]}{.metadata.namespace}{' '}"
+                "{.metadata.name}{'\\n'}{end}",
             ],
             capture_output=True,
             check=True,
         )
 
-        if not (result.stdout or "").strip():
+        pending: dict[str, list[str]] = {}
+        for line in (result.stdout or "").splitlines():
+            if line.strip():
+                ns, pod = line.split()
+                pending.setdefault(ns, []).append(pod)
+        if not pending:
             return
 
-        time.sleep(delay)
+        # Block on exactly the pods that were not Running; kubectl wait
+        # returns as soon as they are (or fails if one goes away), then
+        # the loop re-lists to pick up pods created in the meantime.
+        for ns, pods in pending.items():
+            remaining = int(deadline - time.monotonic())
+            if remaining <= 0:
+                break
+            started = time.monotonic()
+            waited = runner.run(
+                [
+                    "kubectl",
+                    "--kubeconfig",
+                    str(kubeconfig),
+                    "wait",
+                    "-n",
+                    ns,
+                    "--for=jsonpath={.status.phase}=Running",
+                    *(f"pod/{pod}" for pod in pods),
+                    f"--timeout={remaining}s",
+                ],
+                capture_output=True,
+                check=False,
+            )
+            if waited.returncode != 0 and time.monotonic() - started < 5:
+                # Failed straight away (pod deleted, API hiccup): don't spin.
+                time.sleep(5)
 
     raise TimeoutError("Timed out waiting for pods to transition to Running.")
 
@@ -263,37 +333,23 @@ def wait_for_control_plane_ready(
         label="wait_for_control_plane_ready",
     )
 
-    start = time.time()
-
-    while True:
-        if time.time() - start > timeout_seconds:
-            raise TimeoutError(
-                f"Control plane for cluster {cluster_name} did not become ready"
-            )
-
-        cmd = [
-            "kubectl",
+    ready = _kubectl_wait(
+        runner,
+        [
             *(["--context", context] if context else []),
             "-n",
             namespace,
-            "get",
-            "kubeadmcontrolplane",
-            cluster_name,
-            "-o",
-            "jsonpath={.status.ready}",
-        ]
-
-        result = runner.run(
-            cmd,
-            capture_output=True,
-            check=True,
+            "wait",
+            "--for=jsonpath={.status.ready}=true",
+            f"kubeadmcontrolplane/{cluster_name}",
+        ],
+        timeout_seconds=timeout_seconds,
+    )
+    if not ready:
+        raise TimeoutError(
+            f"Control plane for cluster {cluster_name} did not become ready"
         )
 
-        if (result.stdout or "").strip() == "true":
-            return
-
-        time.sleep(10)
-
 
 def deploy_cni(
     kubeconfig: Path,
@@ -400,70 +456,52 @@ def wait_for_cni_ready(
         label="wait_for_cni_ready",
     )
 
-    for attempt in range(1, retries + 1):
-        result = runner.run(
-            [
-                "kubectl",
-                "--kubeconfig",
-                str(kubeconfig),
-                "get",
-                "pods",
-                "-n",
-                "kube-system",
-                "-l",
-                "k8s-app=cilium",
-                "-o",
-                "jsonpath={range .items[*]}{.metadata.name}{' '}{.status.phase}{'\\n'}{end}",
-            ],
-            capture_output=True,
-            check=True,
-        )
+    ready = _kubectl_wait(
+        runner,
+        [
+            "--kubeconfig",
+            str(kubeconfig),
+            "wait",
+            "-n",
+            "kube-system",
+            "--for=jsonpath={.status.phase}=Running",
+            "pods",
+            "-l",
+            "k8s-app=cilium",
+        ],
+        timeout_seconds=retries * delay,
+        retry_delay=delay,
+    )
 
-        lines = (result.stdout or "").strip().splitlines()
-        total = len(lines)
-        running = sum(1 for l in lines if l.endswith(" Running"))
+    # Show full pod status for visibility either way
+    pods_out = runner.run(
+        [
+            "kubectl",
+            "--kubeconfig",
+            str(kubeconfig),
+            "get",
+            "pods",
+            "-n",
+            "kube-system",
+            "-l",
+            "k8s-app=cilium",
+            "-o",
+            "wide",
+        ],
+        capture_output=True,
+        check=False,
+    ).stdout or ""
 
-        msg = (
-            f"[wait_for_cni_ready] Attempt {attempt}/{retries}: "
-            f"{running}/{total} Cilium pods Running"
-        )
+    log.debug(pods_out)
+    if runner.logger:
+        runner.logger.info("\n" + pods_out)
 
-        log.debug(msg)
+    if ready:
+        success_msg = "[wait_for_cni_ready] SUCCESS: All Cilium pods are Running"
+        log.debug(success_msg)
         if runner.logger:
-            runner.logger.info(msg)
-
-        # Periodically show full pod status for visibility
-        if attempt == 1 or attempt % 5 == 0:
-            pods_out = runner.run(
-                [
-                    "kubectl",
-                    "--kubeconfig",
-                    str(kubeconfig),
-                    "get",
-                    "pods",
-                    "-n",
-                    "kube-system",
-                    "-l",
-                    "k8s-app=cilium",
-                    "-o",
-                    "wide",
-                ],
-                capture_output=True,
-                check=True,
-            ).stdout
-
-            log.debug(pods_out)
-            if runner.logger:
-                runner.logger.info("\n" + pods_out)
-
-        if total > 0 and running == total:
-            success_msg = "[wait_for_cni_ready] SUCCESS: All Cilium pods are Running"
-            log.debug(success_msg)
-            if runner.logger:
-                runner.logger.info(success_msg)
-            return
-
-        time.sleep(delay)
+            runner.logger.info(success_msg)
+        return
 
     raise TimeoutError("Timed out waiting for Cilium pods to become Ready")
 
@@ -523,41 +561,25 @@ def update_hosts_and_inventory(
         next(int2_iter)
 
     hosts_path = Path("/etc/hosts")
-    existing_lines = hosts_path.read_text(encoding="utf-8").splitlines()
-
-    new_hosts_lines = list(existing_lines)
-
-    def _remove_node_entries(
-        lines: list[str],
-        *,
-        ip: str,
-        name: str,
-        fqdn: str,
-    ) -> list[str]:
-        """Remove any /etc/hosts lines that conflict with this node."""
-        filtered: list[str] = []
-
-        for line in lines:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                filtered.append(line)
-                continue
-
-            parts = stripped.split()
-            line_ip = parts[0]
-            names = parts[1:]
-
-            # 🔥 Remove if IP OR hostname OR FQDN matches
-            if (
-                line_ip == ip
-                or name in names
-                or fqdn in names
-            ):
-                continue
-
-            filtered.append(line)
-
-        return filtered
+    hosts_lines = hosts_path.read_text(encoding="utf-8").splitlines()
+
+    # Index /etc/hosts once by IP and by name, so finding a node's
+    # conflicting entries is a dict lookup instead of a rescan of every line.
+    ip_index: dict[str, list[int]] = {}
+    name_index: dict[str, list[int]] = {}
+    removed: set[int] = set()
+
+    def _index_line(idx: int, line: str) -> None:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            return
+        parts = stripped.split()
+        ip_index.setdefault(parts[0], []).append(idx)
+        for host in parts[1:]:
+            name_index.setdefault(host, []).append(idx)
+
+    for idx, line in enumerate(hosts_lines):
+        _index_line(idx, line)
 
     for node in items:
         name = node["metadata"]["name"]
@@ -584,16 +606,18 @@ def update_hosts_and_inventory(
         else:
             computes.append(entry)
 
-        # 🔥 HARD CLEAN: remove all conflicting entries
-        new_hosts_lines = _remove_node_entries(
-            new_hosts_lines,
-            ip=ip,
-            name=name,
-            fqdn=fqdn,
-        )
+        # 🔥 HARD CLEAN: remove if IP OR hostname OR FQDN matches
+        removed.update(ip_index.get(ip, ()))
+        removed.update(name_index.get(name, ()))
+        removed.update(name_index.get(fqdn, ()))
 
         # Append canonical entry
-        new_hosts_lines.append(f"{ip} {name} {fqdn}")
+        hosts_lines.append(f"{ip} {name} {fqdn}")
+        _index_line(len(hosts_lines) - 1, hosts_lines[-1])
+
+    new_hosts_lines = [
+        line for idx, line in enumerate(hosts_lines) if idx not in removed
+    ]
 
     # Write updated hosts file to a user-writable temp location
     tmp_hosts = Path("/tmp/hosts.tmp")
@@ -626,32 +650,37 @@ def update_hosts_and_inventory(
 
 
 def label_and_taint_nodes(self, opts: SetupOptions, entries: List[Tuple[str, str]]) -> None:
-    for _, hostname in entries:
-        self.runner.run(
-            [
-                "kubectl",
-                "--kubeconfig",
-                str(opts.workload_kubeconfig),
-                "label",
-                "node",
-                hostname,
-                "node.cilium.io/agent-not-ready=true",
-                "kubernetes.io/os=linux",
-                "--overwrite",
-            ],
-            check=False,
-        )
+    hostnames = [hostname for _, hostname in entries]
+    if not hostnames:
+        return
 
-        self.runner.run(
-            [
-                "kubectl",
-                "--kubeconfig",
-                str(opts.workload_kubeconfig),
-                "taint",
-                "node",
-                hostname,
-                "node.cilium.io/agent-not-ready=true:NoSchedule",
-                "--overwrite",
-            ],
-            check=False,
-        )
+    # kubectl label/taint accept several node names and carry on past
+    # missing ones, so two calls cover the whole batch.
+    self.runner.run(
+        [
+            "kubectl",
+            "--kubeconfig",
+            str(opts.workload_kubeconfig),
+            "label",
+            "node",
+            *hostnames,
+            "node.cilium.io/agent-not-ready=true",
+            "kubernetes.io/os=linux",
+            "--overwrite",
+        ],
+        check=False,
+    )
+
+    self.runner.run(
+        [
+            "kubectl",
+            "--kubeconfig",
+            str(opts.workload_kubeconfig),
+            "taint",
+            "node",
+            *hostnames,
+            "node.cilium.io/agent-not-ready=true:NoSchedule",
+            "--overwrite",
+        ],
+        check=False,
+    )
@@ -15,12 +15,14 @@ class MonitoringManager:
         self.ssh = ssh
 
     def deploy(self, components):
-        logger = InfraJsonlLogger()
-        engine = HelmInfraEngine(
-            helm=self.helm,
-            ssh=self.ssh,
-            logger=logger,
-        )
+        with InfraJsonlLogger() as logger:
+            engine = HelmInfraEngine(
+                helm=self.helm,
+                ssh=self.ssh,
+                logger=logger,
+            )
+            engine.load_deployed_releases(components)
+            engine.add_repos(components)
 
-        for component in components:
-            engine.deploy(component)
+            for component in components:
+                engine.deploy(component)
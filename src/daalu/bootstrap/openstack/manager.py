@@ -15,12 +15,15 @@ class OpenStackManager:
         self.ssh = ssh
 
     def deploy(self, components, *, phase: str | None = None):
-        logger = InfraJsonlLogger()
-        engine = HelmInfraEngine(
-            helm=self.helm,
-            ssh=self.ssh,
-            logger=logger,
-        )
+        with InfraJsonlLogger() as logger:
+            engine = HelmInfraEngine(
+                helm=self.helm,
+                ssh=self.ssh,
+                logger=logger,
+            )
+            engine.load_deployed_releases(components)
+            if phase in (None, "helm"):
+                engine.add_repos(components)
 
-        for component in components:
-            engine.deploy(component, phase=phase)
+            for component in components:
+                engine.deploy(component, phase=phase)
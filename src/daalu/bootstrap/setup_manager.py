@@ -247,35 +247,40 @@ class SetupManager:
         return entries
 
     def label_and_taint_nodes(self, opts: SetupOptions, entries: List[Tuple[str, str]]) -> None:
-        for _, hostname in entries:
-            self.runner.run(
-                [
-                    "kubectl",
-                    "--kubeconfig",
-                    str(opts.workload_kubeconfig),
-                    "label",
-                    "node",
-                    hostname,
-                    "node.cilium.io/agent-not-ready=true",
-                    "kubernetes.io/os=linux",
-                    "--overwrite",
-                ],
-                check=False,
-            )
+        hostnames = [hostname for _, hostname in entries]
+        if not hostnames:
+            return
 
-            self.runner.run(
-                [
-                    "kubectl",
-                    "--kubeconfig",
-                    str(opts.workload_kubeconfig),
-                    "taint",
-                    "node",
-                    hostname,
-                    "node.cilium.io/agent-not-ready=true:NoSchedule",
-                    "--overwrite",
-                ],
-                check=False,
-            )
+        # kubectl label/taint accept several node names and carry on past
+        # missing ones, so two calls cover the whole batch.
+        self.runner.run(
+            [
+                "kubectl",
+                "--kubeconfig",
+                str(opts.workload_kubeconfig),
+                "label",
+                "node",
+                *hostnames,
+                "node.cilium.io/agent-not-ready=true",
+                "kubernetes.io/os=linux",
+                "--overwrite",
+            ],
+            check=False,
+        )
+
+        self.runner.run(
+            [
+                "kubectl",
+                "--kubeconfig",
+                str(opts.workload_kubeconfig),
+                "taint",
+                "node",
+                *hostnames,
+                "node.cilium.io/agent-not-ready=true:NoSchedule",
+                "--overwrite",
+            ],
+            check=False,
+        )
 
     def get_api_endpoint_from_kubeconfig(self, opts: SetupOptions) -> tuple[str, int]:
         """
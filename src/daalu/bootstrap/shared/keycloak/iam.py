@@ -43,14 +43,11 @@ class KeycloakIAMManager:
 
     def _has_secretgen(self, kubectl) -> bool:
         if self._secretgen_available is None:
-            rc, _, _ = kubectl._run("api-resources --api-group=secretgen.k14s.io")
-            self._secretgen_available = rc == 0 and True
-            # Double-check: rc==0 but empty output means the group doesn't exist
-            if rc == 0:
-                rc2, out, _ = kubectl._run(
-                    "api-resources --api-group=secretgen.k14s.io -o name"
-                )
-                self._secretgen_available = bool(out.strip())
+            # rc==0 with empty output means the group doesn't exist.
+            rc, out, _ = kubectl._run(
+                "api-resources --api-group=secretgen.k14s.io -o name"
+            )
+            self._secretgen_available = rc == 0 and bool(out.strip())
         return self._secretgen_available
 
     # ----------------------------
@@ -1,17 +1,25 @@
 # Copyright 2026 Kezie Iwueke
 # SPDX-License-Identifier: Apache-2.0
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from pathlib import Path
 import os
 import re
 
+JINJA_BYTECODE_CACHE_DIR = Path.home() / ".daalu" / "cache" / "jinja"
+
 def expand_env_vars(value: str) -> str:
     return re.sub(r"\$\{([^}^{]+)\}", lambda m: os.getenv(m.group(1), m.group(0)), value)
 
 class TemplateRenderer:
     def __init__(self, templates_dir: Path):
-        self.env = Environment(loader=FileSystemLoader(str(templates_dir)), autoescape=False)
+        JINJA_BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.env = Environment(
+            loader=FileSystemLoader(str(templates_dir)),
+            autoescape=False,
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(str(JINJA_BYTECODE_CACHE_DIR)),
+        )
 
     def render(self, template_name: str, context: dict) -> str:
         expanded = {k: expand_env_vars(str(v)) if isinstance(v, str) else v for k, v in context.items()}
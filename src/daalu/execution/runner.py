@@ -6,7 +6,7 @@ from __future__ import annotations
 import subprocess
 import time
 from dataclasses import dataclass
-from typing import Optional, Sequence, Union
+from typing import Iterator, Optional, Sequence, Union
 from pathlib import Path
 
 Cmd = Sequence[Union[str, "os.PathLike[str]"]]
@@ -77,3 +77,49 @@ class CommandRunner:
             self.logger.log(f"[{label}][exit {result.returncode}] ({duration:.2f}s)")
 
         return result
+
+    def run_streaming(
+        self,
+        cmd: Cmd,
+        *,
+        cwd: str | None = None,
+        env: dict[str, str] | None = None,
+    ) -> Iterator[str]:
+        """
+        Run a command and yield its combined stdout/stderr line by line.
+
+        The caller may stop iterating early; closing the generator terminates
+        the process so the remaining output is never read.
+        """
+        label = self.label or "cmd"
+        cmd_str = " ".join(map(str, cmd))
+
+        if self.logger:
+            self.logger.log(f"[{label}] $ {cmd_str}")
+
+        if self.dry_run:
+            if self.logger:
+                self.logger.log(f"[{label}] dry-run: skipped execution")
+            return
+
+        start = time.time()
+        proc = subprocess.Popen(
+            list(cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            cwd=cwd,
+            env=env,
+        )
+        try:
+            for line in proc.stdout:
+                yield line
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            rc = proc.wait()
+            if self.logger:
+                duration = time.time() - start
+                self.logger.log(f"[{label}][exit {rc}] ({duration:.2f}s)")
@@ -165,6 +165,22 @@ class HelmCliRunner(IHelm):
         except Exception:
             return False
 
+    def list_releases(self, namespaces: set[str] | None = None) -> set[tuple[str, str]]:
+        """
+        Return {(namespace, release_name)} for every release in 'deployed'
+        status, using a single `helm list -A` call.
+        """
+        import json as _json
+
+        argv = self._base() + ["list", "-A", "--max", "0", "-o", "json"]
+        out = self._run(argv, allow_rc={0}, capture=True, sudo=True)
+        return {
+            (r["namespace"], r["name"])
+            for r in _json.loads(out or "[]")
+            if r.get("status") == "deployed"
+            and (namespaces is None or r["namespace"] in namespaces)
+        }
+
     def upgrade_install(self, rel: ReleaseSpec, debug: bool = False) -> None:
         argv = (
             self._base()
@@ -11,6 +11,7 @@ class IHelm(Protocol):
     def update_repos(self) -> None: ...
     def upgrade_install(self, rel: ReleaseSpec) -> None: ...
     def release_is_deployed(self, release_name: str, namespace: str) -> bool: ...
+    def list_releases(self, namespaces: set[str] | None = None) -> set[tuple[str, str]]: ...
     def uninstall(self, release_name: str, namespace: str) -> None: ...
     def diff(self, rel: ReleaseSpec) -> str: ...
     def lint(self, rel: ReleaseSpec) -> None: ...
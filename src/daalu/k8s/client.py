@@ -4,15 +4,48 @@
 # src/daalu/k8s/client.py
 from __future__ import annotations
 
+import threading
 import time
 from typing import Optional
 
 # We keep this import optional so unit tests can run without the package.
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, watch
 except Exception:  # pragma: no cover - optional dependency
     client = None
     config = None
+    watch = None
+
+_api_clients: dict[tuple[Optional[str], Optional[str]], object] = {}
+_api_clients_lock = threading.Lock()
+
+
+def get_api_client(kubeconfig: Optional[str] = None, kube_context: Optional[str] = None):
+    """
+    Return an ApiClient for (kubeconfig, kube_context), built once per process.
+
+    Unlike load_kube_config() this does not touch the global default
+    configuration, so clients for different clusters can coexist.
+    """
+    if client is None or config is None:
+        raise RuntimeError("kubernetes package is not installed")
+
+    key = (kubeconfig, kube_context)
+    with _api_clients_lock:
+        api = _api_clients.get(key)
+        if api is None:
+            api = config.new_client_from_config(config_file=kubeconfig, context=kube_context)
+            _api_clients[key] = api
+    return api
+
+
+def get_default_namespace(kubeconfig: Optional[str] = None, kube_context: Optional[str] = None) -> str:
+    """Namespace kubectl would use for (kubeconfig, kube_context)."""
+    contexts, active = config.list_kube_config_contexts(config_file=kubeconfig)
+    ctx = active
+    if kube_context:
+        ctx = next((c for c in contexts if c["name"] == kube_context), active)
+    return (ctx or {}).get("context", {}).get("namespace") or "default"
 
 
 def wait_for_rollout(namespace: str, selector: str, timeout_seconds: int = 300, kube_context: Optional[str] = None) -> None:
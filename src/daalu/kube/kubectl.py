@@ -8,13 +8,14 @@ from __future__ import annotations
 import json
 import logging
 import time
-import yaml
 import base64
 import subprocess
 from typing import Iterable
+from pathlib import Path
 from typing import Any
 
 
+from daalu.k8s import client as k8s_client
 from daalu.utils.ssh_runner import SSHRunner
 
 log = logging.getLogger("daalu")
@@ -67,6 +68,17 @@ class KubectlRunner:
 
         return rc, out, err
 
+    def _local_api_client(self):
+        """
+        Shared ApiClient for this cluster, or None when the kubernetes
+        package is missing or `kubeconfig` only exists on the remote host.
+        """
+        if k8s_client.client is None or not self.kubeconfig:
+            return None
+        if not Path(self.kubeconfig).is_file():
+            return None
+        return k8s_client.get_api_client(self.kubeconfig)
+
 
 
     def apply_file(
@@ -103,6 +115,25 @@ class KubectlRunner:
             force_conflicts=force_conflicts,
         )
 
+    def apply_local_file(
+        self,
+        local_path,
+        *,
+        remote_path: str,
+        server_side: bool = False,
+        force_conflicts: bool = False,
+    ) -> None:
+        """
+        Upload a manifest that already sits on local disk and apply it,
+        without reading it into memory first.
+        """
+        self.ssh.put_file(local_path, remote_path)
+        self.apply_file(
+            remote_path,
+            server_side=server_side,
+            force_conflicts=force_conflicts,
+        )
+
 
     def get_pods(self, namespace: str) -> list[dict]:
         rc, out, err = self._run(f"get pods -n {namespace} -o json")
@@ -125,6 +156,26 @@ class KubectlRunner:
         retries: int = 20,
         delay: int = 10,
     ) -> None:
+        api = self._local_api_client()
+        if api is not None:
+            try:
+                if self._watch_pods_running(
+                    api, namespace, min_running, timeout=retries * delay,
+                ):
+                    return
+            except Exception as e:
+                # Watch connection problems fall through to polling over SSH
+                log.debug(
+                    "[kubectl] Pod watch in '%s' failed (%s); polling instead",
+                    namespace, e,
+                )
+            else:
+                summary = self._pod_status_summary(namespace)
+                raise KubectlError(
+                    f"Timed out waiting for {min_running} pods in namespace "
+                    f"'{namespace}'. Pod status: {summary}"
+                )
+
         for attempt in range(retries):
             running = self.count_running_pods(namespace)
             if running >= min_running:
@@ -145,6 +196,39 @@ class KubectlRunner:
             f"Pod status: {summary}"
         )
 
+    def _watch_pods_running(
+        self, api, namespace: str, min_running: int, *, timeout: int,
+    ) -> bool:
+        """
+        Follow pod events in `namespace` until at least `min_running` pods
+        are in phase Running. Returns False if `timeout` expires first.
+        """
+        if min_running <= 0:
+            return True
+
+        core = k8s_client.client.CoreV1Api(api)
+        running: set[str] = set()
+        w = k8s_client.watch.Watch()
+        try:
+            # The initial ADDED events replay current state, so pods that are
+            # already running count immediately.
+            for event in w.stream(
+                core.list_namespaced_pod,
+                namespace=namespace,
+                timeout_seconds=timeout,
+            ):
+                pod = event["object"]
+                uid = pod.metadata.uid
+                if event["type"] != "DELETED" and pod.status.phase == "Running":
+                    running.add(uid)
+                else:
+                    running.discard(uid)
+                if len(running) >= min_running:
+                    return True
+        finally:
+            w.stop()
+        return False
+
     def _pod_status_summary(self, namespace: str) -> str:
         """Return a brief summary of pod phases and container reasons."""
         try:
@@ -214,7 +298,13 @@ class KubectlRunner:
                 )
             return
 
-        manifest = yaml.safe_dump_all(objects, sort_keys=False)
+        # kubectl reads JSON as well as YAML; a v1 List keeps document order
+        # and is much cheaper to produce than a YAML multi-doc stream.
+        manifest = json.dumps(
+            {"apiVersion": "v1", "kind": "List", "items": objects},
+            separators=(",", ":"),
+            default=str,
+        )
 
         try:
             self.apply_content(
@@ -255,6 +345,40 @@ class KubectlRunner:
                 )
 
 
+    def create_objects(
+        self,
+        objects: Iterable[dict],
+        *,
+        remote_path: str = "/tmp/daalu-create.json",
+    ) -> None:
+        """
+        kubectl create for objects that must never be overwritten once they
+        exist (e.g. generated credentials). Objects that already exist are
+        left untouched and are not treated as an error.
+        """
+        objects = list(objects)
+        if not objects:
+            return
+
+        manifest = json.dumps(
+            {"apiVersion": "v1", "kind": "List", "items": objects},
+            separators=(",", ":"),
+            default=str,
+        )
+        self.ssh.put_text(manifest, remote_path)
+
+        rc, out, err = self._run(f"create -f {remote_path}")
+        if rc == 0:
+            return
+
+        failures = [
+            line
+            for line in (err or out).splitlines()
+            if line.strip() and "AlreadyExists" not in line
+        ]
+        if failures:
+            raise KubectlError(f"kubectl create failed: {err or out}")
+
     def get_names(
         self,
         *,
@@ -434,6 +558,74 @@ class KubectlRunner:
 
             time.sleep(interval_seconds)
 
+    def watch_crd(
+        self,
+        name: str,
+        *,
+        timeout: int = 300,
+        max_interval_seconds: float = 10,
+    ) -> None:
+        """
+        Block until CustomResourceDefinition `name` reports Established=True.
+
+        Uses a Kubernetes watch filtered on metadata.name when the kubernetes
+        package is installed and `kubeconfig` exists on this machine, so we
+        return on the first ADDED/MODIFIED event instead of at the next poll.
+        Otherwise polls the CRD's Established condition over SSH, one kubectl
+        call per attempt, backing off from 0.5s to `max_interval_seconds`.
+        """
+        api = self._local_api_client()
+        if api is not None:
+            self._watch_crd_established(api, name, timeout)
+            return
+
+        start = time.time()
+        cmd = (
+            f"get crd {name} -o "
+            "jsonpath='{.status.conditions[?(@.type==\"Established\")].status}'"
+        )
+        delay = 0.5
+        attempt = 0
+        while True:
+            attempt += 1
+            rc, out, err = self._run(cmd)
+            if rc == 0 and out.strip() == "True":
+                return
+            if time.time() - start > timeout:
+                raise TimeoutError(
+                    f"Timed out waiting for CRD {name} to be established. "
+                    f"Last error: {err.strip()}"
+                )
+            if attempt % 5 == 0:
+                log.debug(
+                    "[kubectl] CRD %s not established yet (attempt %d)",
+                    name, attempt,
+                )
+            time.sleep(delay)
+            delay = min(delay * 1.5, max_interval_seconds)
+
+    def _watch_crd_established(self, api, name: str, timeout: int) -> None:
+        api = k8s_client.client.ApiextensionsV1Api(api)
+        w = k8s_client.watch.Watch()
+        try:
+            for event in w.stream(
+                api.list_custom_resource_definition,
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=timeout,
+            ):
+                if event["type"] not in ("ADDED", "MODIFIED"):
+                    continue
+                conditions = event["object"].status.conditions or []
+                if any(
+                    c.type == "Established" and c.status == "True"
+                    for c in conditions
+                ):
+                    return
+        finally:
+            w.stop()
+
+        raise TimeoutError(f"Timed out waiting for CRD {name} to be established")
+
     def wait_for_condition(
         self,
         *,
@@ -0,0 +1,34 @@
+# Copyright 2026 Kezie Iwueke
+# SPDX-License-Identifier: Apache-2.0
+
+# src/daalu/utils/dirhash.py
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+
+def sha256_tree(path: Path) -> str:
+    """
+    Return a sha256 hex digest over every file under `path`.
+
+    Files are visited in sorted order and both the relative path and the
+    contents are hashed, so renames and edits both change the digest.
+    """
+    h = hashlib.sha256()
+    root = Path(path)
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            full = Path(dirpath) / name
+            h.update(full.relative_to(root).as_posix().encode())
+            h.update(b"\0")
+            with full.open("rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    h.update(chunk)
+            h.update(b"\0")
+
+    return h.hexdigest()
@@ -683,41 +683,25 @@ def update_hosts_and_inventory(
         next(int2_iter)
 
     hosts_path = Path("/etc/hosts")
-    existing_lines = hosts_path.read_text(encoding="utf-8").splitlines()
-
-    new_hosts_lines = list(existing_lines)
-
-    def _remove_node_entries(
-        lines: list[str],
-        *,
-        ip: str,
-        name: str,
-        fqdn: str,
-    ) -> list[str]:
-        """Remove any /etc/hosts lines that conflict with this node."""
-        filtered: list[str] = []
-
-        for line in lines:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                filtered.append(line)
-                continue
-
-            parts = stripped.split()
-            line_ip = parts[0]
-            names = parts[1:]
-
-            # 🔥 Remove if IP OR hostname OR FQDN matches
-            if (
-                line_ip == ip
-                or name in names
-                or fqdn in names
-            ):
-                continue
-
-            filtered.append(line)
-
-        return filtered
+    hosts_lines = hosts_path.read_text(encoding="utf-8").splitlines()
+
+    # Index /etc/hosts once by IP and by name, so finding a node's
+    # conflicting entries is a dict lookup instead of a rescan of every line.
+    ip_index: dict[str, list[int]] = {}
+    name_index: dict[str, list[int]] = {}
+    removed: set[int] = set()
+
+    def _index_line(idx: int, line: str) -> None:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            return
+        parts = stripped.split()
+        ip_index.setdefault(parts[0], []).append(idx)
+        for host in parts[1:]:
+            name_index.setdefault(host, []).append(idx)
+
+    for idx, line in enumerate(hosts_lines):
+        _index_line(idx, line)
 
     for node in items:
         name = node["metadata"]["name"]
@@ -744,16 +728,18 @@ def update_hosts_and_inventory(
         else:
             computes.append(entry)
 
-        # 🔥 HARD CLEAN: remove all conflicting entries
-        new_hosts_lines = _remove_node_entries(
-            new_hosts_lines,
-            ip=ip,
-            name=name,
-            fqdn=fqdn,
-        )
+        # 🔥 HARD CLEAN: remove if IP OR hostname OR FQDN matches
+        removed.update(ip_index.get(ip, ()))
+        removed.update(name_index.get(name, ()))
+        removed.update(name_index.get(fqdn, ()))
 
         # Append canonical entry
-        new_hosts_lines.append(f"{ip} {name} {fqdn}")
+        hosts_lines.append(f"{ip} {name} {fqdn}")
+        _index_line(len(hosts_lines) - 1, hosts_lines[-1])
+
+    new_hosts_lines = [
+        line for idx, line in enumerate(hosts_lines) if idx not in removed
+    ]
 
     # Write updated hosts file to a user-writable temp location
     tmp_hosts = Path("/tmp/hosts.tmp")
@@ -786,35 +772,40 @@ def update_hosts_and_inventory(
 
 
 def label_and_taint_nodes(self, opts: SetupOptions, entries: List[Tuple[str, str]]) -> None:
-    for _, hostname in entries:
-        self.runner.run(
-            [
-                "kubectl",
-                "--kubeconfig",
-                str(opts.workload_kubeconfig),
-                "label",
-                "node",
-                hostname,
-                "node.cilium.io/agent-not-ready=true",
-                "kubernetes.io/os=linux",
-                "--overwrite",
-            ],
-            check=False,
-        )
+    hostnames = [hostname for _, hostname in entries]
+    if not hostnames:
+        return
 
-        self.runner.run(
-            [
-                "kubectl",
-                "--kubeconfig",
-                str(opts.workload_kubeconfig),
-                "taint",
-                "node",
-                hostname,
-                "node.cilium.io/agent-not-ready=true:NoSchedule",
-                "--overwrite",
-            ],
-            check=False,
-        )
+    # kubectl label/taint accept several node names and carry on past
+    # missing ones, so two calls cover the whole batch.
+    self.runner.run(
+        [
+            "kubectl",
+            "--kubeconfig",
+            str(opts.workload_kubeconfig),
+            "label",
+            "node",
+            *hostnames,
+            "node.cilium.io/agent-not-ready=true",
+            "kubernetes.io/os=linux",
+            "--overwrite",
+        ],
+        check=False,
+    )
+
+    self.runner.run(
+        [
+            "kubectl",
+            "--kubeconfig",
+            str(opts.workload_kubeconfig),
+            "taint",
+            "node",
+            *hostnames,
+            "node.cilium.io/agent-not-ready=true:NoSchedule",
+            "--overwrite",
+        ],
+        check=False,
+    )
 
 
 
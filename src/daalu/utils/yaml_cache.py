@@ -0,0 +1,33 @@
+# Copyright 2026 Kezie Iwueke
+# SPDX-License-Identifier: Apache-2.0
+
+# src/daalu/utils/yaml_cache.py
+
+from __future__ import annotations
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from daalu.utils.yaml_fast import safe_load
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns/size are only part of the key: an edited file gets a new
+    # entry instead of a stale hit.
+    with open(path_str, "rb") as f:
+        return safe_load(f)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """
+    Parse a YAML file once per (path, mtime, size) for the whole process.
+
+    Returns a deep copy of the cached document, so callers are free to
+    mutate what they get back.
+    """
+    st = Path(path).stat()
+    data = _load_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(data)
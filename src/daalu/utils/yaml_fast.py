@@ -0,0 +1,23 @@
+# Copyright 2026 Kezie Iwueke
+# SPDX-License-Identifier: Apache-2.0
+
+# src/daalu/utils/yaml_fast.py
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pure-Python PyYAML build
+    from yaml import SafeLoader as _Loader
+
+HAS_LIBYAML = _Loader is not yaml.SafeLoader
+
+
+def safe_load(stream: Any) -> Any:
+    """Drop-in for yaml.safe_load that prefers the C loader."""
+    return yaml.load(stream, Loader=_Loader)
@@ -0,0 +1,28 @@
+from daalu.bootstrap.cluster_api_manager import _scan_describe_ready
+
+
+DESCRIBE = """\
+NAME                                                  READY  SEVERITY  REASON
+Cluster/c1                                            {cluster}
+├─ClusterInfrastructure - Metal3Cluster/c1            True
+├─ControlPlane - KubeadmControlPlane/c1-control-plane {kcp}
+│ └─Machine/c1-control-plane-abc                      True
+"""
+
+
+def _scan(cluster, kcp):
+    seen: list[str] = []
+    text = DESCRIBE.format(cluster=cluster, kcp=kcp)
+    return _scan_describe_ready(text.splitlines(True), "c1", seen), seen
+
+
+def test_infrastructure_row_does_not_count_as_cluster_ready():
+    (cluster_ready, control_plane_ready), _ = _scan("False", "True")
+    assert cluster_ready is False
+    assert control_plane_ready is True
+
+
+def test_both_ready_stops_after_control_plane_row():
+    (cluster_ready, control_plane_ready), seen = _scan("True", "True")
+    assert cluster_ready and control_plane_ready
+    assert seen[-1].lstrip("├─ ").startswith("ControlPlane")
@@ -0,0 +1,103 @@
+import types
+
+from daalu.bootstrap.engine.helm_engine import HelmInfraEngine
+
+
+class RecordingHelm:
+    def __init__(self):
+        self.calls = []
+
+    def add_repo(self, repo):
+        self.calls.append(("add", repo.name))
+
+    def update_repos(self):
+        self.calls.append(("update",))
+
+
+def chart_comp(name, repo, local_chart_dir=None):
+    return types.SimpleNamespace(
+        name=name,
+        repo_name=repo,
+        repo_url=f"https://{repo}.example.com",
+        uses_helm=True,
+        local_chart_dir=local_chart_dir,
+    )
+
+
+def test_add_repos_refreshes_once_per_batch():
+    helm = RecordingHelm()
+    engine = HelmInfraEngine(helm=helm, ssh=None)
+
+    engine.add_repos([
+        chart_comp("a", "bitnami"),
+        chart_comp("b", "bitnami"),
+        chart_comp("c", "jetstack"),
+        chart_comp("istio", "istio", local_chart_dir="/charts"),
+    ])
+    assert helm.calls == [("add", "bitnami"), ("add", "jetstack")]
+
+    # deploy() of each component: repo already added, one update in total
+    for name, repo in [("a", "bitnami"), ("b", "bitnami"), ("c", "jetstack")]:
+        engine._ensure_repo(chart_comp(name, repo))
+        engine._update_repos_if_needed()
+
+    assert helm.calls == [("add", "bitnami"), ("add", "jetstack"), ("update",)]
+
+
+def test_repo_added_mid_batch_is_refreshed_before_its_install():
+    helm = RecordingHelm()
+    engine = HelmInfraEngine(helm=helm, ssh=None)
+
+    engine._ensure_repo(chart_comp("a", "bitnami"))
+    engine._update_repos_if_needed()
+    engine._ensure_repo(chart_comp("b", "jetstack"))
+    engine._update_repos_if_needed()
+
+    assert helm.calls == [
+        ("add", "bitnami"), ("update",),
+        ("add", "jetstack"), ("update",),
+    ]
+
+
+class ListingHelm:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.status_checks = []
+
+    def list_releases(self, namespaces):
+        if self.fail:
+            raise RuntimeError("helm list failed")
+        return {("infra", "metallb")}
+
+    def release_is_deployed(self, name, namespace):
+        self.status_checks.append((namespace, name))
+        return False
+
+
+def release_comp(name, namespace="infra"):
+    return types.SimpleNamespace(
+        name=name, release_name=name, namespace=namespace, uses_helm=True,
+    )
+
+
+def test_load_deployed_releases_answers_from_one_listing():
+    helm = ListingHelm()
+    engine = HelmInfraEngine(helm=helm, ssh=None)
+    components = [release_comp("metallb"), release_comp("argocd")]
+
+    engine.load_deployed_releases(components)
+
+    assert engine._release_is_deployed(components[0])
+    assert not engine._release_is_deployed(components[1])
+    assert helm.status_checks == []
+
+
+def test_load_deployed_releases_falls_back_to_status_checks():
+    helm = ListingHelm(fail=True)
+    engine = HelmInfraEngine(helm=helm, ssh=None)
+    component = release_comp("metallb")
+
+    engine.load_deployed_releases([component])
+
+    assert not engine._release_is_deployed(component)
+    assert helm.status_checks == [("infra", "metallb")]
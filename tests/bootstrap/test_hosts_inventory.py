@@ -0,0 +1,27 @@
+import pytest
+
+from daalu.bootstrap import hosts_inventory
+
+pytest.importorskip("kubernetes")
+urllib3 = pytest.importorskip("urllib3")
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        urllib3.exceptions.MaxRetryError(None, "/api/v1/nodes/n1", "refused"),
+        ConnectionRefusedError("connection refused"),
+    ],
+)
+def test_unreachable_api_server_is_a_status_not_an_exception(monkeypatch, error):
+    def boom(kubeconfig, kube_context):
+        raise error
+
+    monkeypatch.delenv("DAALU_USE_KUBECTL_BIN", raising=False)
+    monkeypatch.setattr(hosts_inventory.k8s_client, "get_api_client", boom)
+
+    rc, err = hosts_inventory._kubectl_json_rc(["get", "node", "n1"])
+    assert rc == 1
+    assert "cannot reach the API server" in err
+
+    assert hosts_inventory.get_node_internal_ip("n1") is None
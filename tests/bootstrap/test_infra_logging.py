@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from daalu.bootstrap.engine.infra_logging import InfraJsonlLogger
+
+
+def test_buffered_events_reach_disk_when_block_raises(tmp_path):
+    with pytest.raises(RuntimeError):
+        with InfraJsonlLogger(log_dir=tmp_path, run_id="r1") as logger:
+            logger.log_event("infra.component.failed", component="x")
+            raise RuntimeError("boom")
+
+    events = [
+        json.loads(line)["event"]
+        for line in (tmp_path / "r1.jsonl").read_text().splitlines()
+    ]
+    assert events == ["infra.run.start", "infra.component.failed"]
+    # closing twice is harmless
+    logger.close()
+
+
+def test_events_after_close_are_appended(tmp_path):
+    logger = InfraJsonlLogger(log_dir=tmp_path, run_id="r2")
+    logger.close()
+
+    logger.log_event("infra.command", cmd="helm list")
+
+    events = [
+        json.loads(line)["event"]
+        for line in (tmp_path / "r2.jsonl").read_text().splitlines()
+    ]
+    assert events == ["infra.run.start", "infra.command"]
@@ -0,0 +1,49 @@
+import types
+
+import pytest
+
+from daalu.bootstrap.engine.infra_logging import InfraJsonlLogger
+from daalu.bootstrap.infrastructure import manager as infra_manager
+
+
+class FakeSSH:
+    def run(self, cmd, sudo=False):
+        return 0, "", ""
+
+    def put_text(self, content, remote_path, sudo=False):
+        pass
+
+
+class FailingEngine:
+    def __init__(self, **kwargs):
+        self.helm = kwargs["helm"]
+
+    def load_deployed_releases(self, components):
+        pass
+
+    def add_repos(self, components):
+        pass
+
+    def deploy(self, component):
+        self.helm.ssh.run("helm upgrade --install x")
+        raise RuntimeError("boom")
+
+
+def test_deploy_restores_helm_ssh_after_failure(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        infra_manager, "InfraJsonlLogger", lambda: InfraJsonlLogger(log_dir=tmp_path)
+    )
+    monkeypatch.setattr(infra_manager, "HelmInfraEngine", FailingEngine)
+
+    kubeconfig = tmp_path / "kubeconfig"
+    kubeconfig.write_text("apiVersion: v1\n")
+    ssh = FakeSSH()
+    helm = types.SimpleNamespace(ssh=ssh)
+    component = types.SimpleNamespace(name="metallb", kubeconfig=str(kubeconfig))
+
+    mgr = infra_manager.InfrastructureManager(helm=helm, ssh=ssh)
+    with pytest.raises(RuntimeError, match="boom"):
+        mgr.deploy([component])
+
+    # later phases (monitoring, openstack) reuse the same helm runner
+    assert helm.ssh is ssh
@@ -0,0 +1,38 @@
+from daalu.bootstrap.infrastructure.components.istio.models import (
+    IstioApplication,
+    IstioDestinationRuleConfig,
+    IstioGatewayConfig,
+    IstioGatewayTLS,
+    IstioServiceConfig,
+    IstioTrafficConfig,
+)
+
+
+def _app(policy):
+    gateway = IstioGatewayConfig(
+        name="gw",
+        namespace="istio-system",
+        selector={"istio": "ingressgateway"},
+        tls=IstioGatewayTLS(mode="SIMPLE", credentialName="cert"),
+    )
+    return IstioApplication(
+        name="app",
+        hostnames=("app.example.com",),
+        traffic_namespace="app-traffic",
+        original_svc_namespace="app",
+        gateway=gateway,
+        service=IstioServiceConfig(name="app-svc", port=80),
+        destinationrule=IstioDestinationRuleConfig(trafficPolicy=policy),
+    )
+
+
+def test_traffic_config_is_hashable():
+    cfg = IstioTrafficConfig(applications=(_app({"tls": {"mode": "DISABLE"}}),))
+    assert hash(cfg) == hash(
+        IstioTrafficConfig(applications=(_app({"tls": {"mode": "DISABLE"}}),))
+    )
+
+
+def test_dict_fields_still_take_part_in_equality():
+    assert _app({"tls": {"mode": "DISABLE"}}) != _app({})
+    assert _app({}).fqdn == "app-svc.app.svc.cluster.local"
@@ -0,0 +1,215 @@
+import json
+import types
+from pathlib import Path
+
+import pytest
+
+from daalu.bootstrap.metal3 import helpers
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class ScriptedRunner:
+    """Stands in for CommandRunner; answers each call with the next rc."""
+
+    def __init__(self, returncodes, clock, cost=0.0, **_):
+        self.returncodes = list(returncodes)
+        self.clock = clock
+        self.cost = cost
+        self.calls = []
+        self.logger = None
+
+    def run(self, cmd, capture_output=False, check=False):
+        self.calls.append(cmd)
+        self.clock.now += self.cost
+        rc = self.returncodes.pop(0) if self.returncodes else 1
+        return types.SimpleNamespace(returncode=rc, stdout="", stderr="boom")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(helpers, "time", clock)
+    return clock
+
+
+def _install_runner(monkeypatch, runner):
+    monkeypatch.setattr(helpers, "CommandRunner", lambda **kw: runner)
+
+
+def test_kubectl_wait_returns_true_on_success(clock):
+    runner = ScriptedRunner([0], clock)
+    assert helpers._kubectl_wait(runner, ["wait", "x"], timeout_seconds=60)
+    assert runner.calls == [["kubectl", "wait", "x", "--timeout=60s"]]
+
+
+def test_kubectl_wait_retries_errors_with_remaining_timeout(clock):
+    runner = ScriptedRunner([1, 1, 0], clock)
+    assert helpers._kubectl_wait(
+        runner, ["wait", "x"], timeout_seconds=60, retry_delay=5
+    )
+    assert [c[-1] for c in runner.calls] == [
+        "--timeout=60s",
+        "--timeout=55s",
+        "--timeout=50s",
+    ]
+
+
+def test_kubectl_wait_gives_up_at_deadline(clock):
+    # Each failed kubectl wait burns its full timeout, as it would for real
+    runner = ScriptedRunner([], clock, cost=30)
+    assert not helpers._kubectl_wait(
+        runner, ["wait", "x"], timeout_seconds=60, retry_delay=5
+    )
+    assert len(runner.calls) == 2
+    assert clock.now >= 60
+
+
+def test_wait_for_control_plane_ready_raises_on_timeout(monkeypatch, clock):
+    runner = ScriptedRunner([], clock, cost=10)
+    _install_runner(monkeypatch, runner)
+
+    with pytest.raises(TimeoutError, match="cluster c1"):
+        helpers.wait_for_control_plane_ready(
+            cluster_name="c1",
+            namespace="ns",
+            ctx=types.SimpleNamespace(logger=None, dry_run=False),
+            context="mgmt",
+            timeout_seconds=30,
+        )
+
+    assert runner.calls[0][:6] == ["kubectl", "--context", "mgmt", "-n", "ns", "wait"]
+    assert "kubeadmcontrolplane/c1" in runner.calls[0]
+
+
+def test_wait_for_cni_ready_success(monkeypatch, clock):
+    # kubectl wait succeeds, then `get pods -o wide` is shown
+    runner = ScriptedRunner([0, 0], clock)
+    _install_runner(monkeypatch, runner)
+
+    helpers.wait_for_cni_ready(
+        Path("/tmp/kc"),
+        ctx=types.SimpleNamespace(logger=None, dry_run=False),
+        retries=3,
+        delay=10,
+    )
+
+    assert runner.calls[0][:4] == ["kubectl", "--kubeconfig", "/tmp/kc", "wait"]
+    assert runner.calls[1][-2:] == ["-o", "wide"]
+
+
+def test_wait_for_cni_ready_raises_on_timeout(monkeypatch, clock):
+    runner = ScriptedRunner([], clock, cost=10)
+    _install_runner(monkeypatch, runner)
+
+    with pytest.raises(TimeoutError, match="Cilium"):
+        helpers.wait_for_cni_ready(
+            Path("/tmp/kc"),
+            ctx=types.SimpleNamespace(logger=None, dry_run=False),
+            retries=3,
+            delay=10,
+        )
+
+    # pod status is still shown before giving up
+    assert runner.calls[-1][-2:] == ["-o", "wide"]
+
+
+def test_wait_for_pods_running_ignores_completed_pods(monkeypatch, clock):
+    # An empty listing means nothing is left to wait for
+    runner = ScriptedRunner([0], clock)
+    _install_runner(monkeypatch, runner)
+
+    helpers.wait_for_pods_running(
+        Path("/tmp/kc"), ctx=types.SimpleNamespace(logger=None, dry_run=False)
+    )
+
+    selector = runner.calls[0][runner.calls[0].index("--field-selector") + 1]
+    assert selector == "status.phase!=Running,status.phase!=Succeeded"
+    assert len(runner.calls) == 1
+
+
+def test_update_hosts_and_inventory_rewrites_conflicting_entries(
+    monkeypatch, tmp_path
+):
+    hosts = "\n".join(
+        [
+            "127.0.0.1 localhost",
+            "# managed below",
+            "10.0.0.5 node-a node-a.example.com",  # existing, unchanged
+            "10.0.0.99 node-b",  # node-b changed IP
+            "10.0.0.7 oldhost",  # IP now taken by a new host
+            "192.168.1.1 gateway",
+        ]
+    )
+    nodes = {
+        "items": [
+            {
+                "metadata": {
+                    "name": name,
+                    "labels": {"node-role.kubernetes.io/control-plane": ""}
+                    if name == "node-a"
+                    else {},
+                },
+                "status": {"addresses": [{"type": "InternalIP", "address": ip}]},
+            }
+            for name, ip in [
+                ("node-a", "10.0.0.5"),
+                ("node-b", "10.0.0.6"),
+                ("node-c", "10.0.0.7"),
+            ]
+        ]
+    }
+    written = {}
+
+    class HostsRunner:
+        logger = None
+
+        def run(self, cmd, capture_output=False, check=False):
+            if cmd[0] == "kubectl":
+                return types.SimpleNamespace(
+                    returncode=0, stdout=json.dumps(nodes), stderr=""
+                )
+            # sudo install -m 0644 <tmp> /etc/hosts
+            written["hosts"] = Path(cmd[-2]).read_text(encoding="utf-8")
+            return types.SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    real_read_text = Path.read_text
+
+    def fake_read_text(self, *args, **kwargs):
+        if str(self) == "/etc/hosts":
+            return hosts
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", fake_read_text)
+    _install_runner(monkeypatch, HostsRunner())
+
+    helpers.update_hosts_and_inventory(
+        kubeconfig=Path("/tmp/kc"),
+        workspace_root=tmp_path,
+        domain_suffix="example.com",
+        ctx=types.SimpleNamespace(logger=None, dry_run=False),
+    )
+
+    assert written["hosts"].splitlines() == [
+        "127.0.0.1 localhost",
+        "# managed below",
+        "192.168.1.1 gateway",
+        "10.0.0.5 node-a node-a.example.com",
+        "10.0.0.6 node-b node-b.example.com",
+        "10.0.0.7 node-c node-c.example.com",
+    ]
+
+    inventory = real_read_text(
+        tmp_path / "cloud-config/inventory/openstack_hosts.ini"
+    )
+    assert "[controllers]\n\nnode-a.example.com ansible_host=10.0.0.5 int2_ip=10.44.0.11\n" in inventory
+    assert "node-c.example.com ansible_host=10.0.0.7 int2_ip=10.44.0.13" in inventory
@@ -0,0 +1,28 @@
+from daalu.bootstrap.infrastructure.components.percona_xtradb_cluster import (
+    PerconaXtraDBClusterComponent,
+)
+
+
+class RecordingKubectl:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, **kwargs):
+        self.calls.append(("get", kwargs))
+        return {}
+
+    def create_objects(self, objects):
+        self.calls.append(("create", list(objects)))
+
+
+def test_pre_install_creates_secret_in_one_call(tmp_path):
+    spec = tmp_path / "pxc.yaml"
+    spec.write_text("_percona_xtradb_cluster_spec:\n  secretsName: pxc-secrets\n")
+    kubectl = RecordingKubectl()
+
+    PerconaXtraDBClusterComponent(spec_path=spec, kubeconfig="kc").pre_install(kubectl)
+
+    [(verb, objects)] = kubectl.calls
+    assert verb == "create"
+    assert objects[0]["metadata"] == {"name": "pxc-secrets", "namespace": "openstack"}
+    assert len(objects[0]["stringData"]) == 7
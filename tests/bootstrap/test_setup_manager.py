@@ -78,7 +78,8 @@ def test_hosts_inventory_helpers(monkeypatch, tmp_path: Path):
     # stub kubectl json helpers
     def fake_json_nodes(args, kube_context=None, kubeconfig=None):
         if "nodes" in args:
-            return {"items":[{"metadata":{"name":"n1"}},{"metadata":{"name":"n2"}}]}
+            addrs = {"addresses":[{"type":"InternalIP","address":"10.20.0.9"}]}
+            return {"items":[{"metadata":{"name":"n1"},"status":addrs},{"metadata":{"name":"n2"},"status":addrs}]}
         raise RuntimeError("unexpected args")
 
     def fake_json_machine(args, kube_context=None, kubeconfig=None):
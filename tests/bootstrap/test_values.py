@@ -0,0 +1,30 @@
+import copy
+
+from daalu.bootstrap.engine.values import deep_merge, deep_merge_into
+
+
+def test_deep_merge_merges_nested_without_mutating_inputs():
+    a = {"image": {"tag": "1.0", "pull": {"policy": "Always"}}, "replicas": 1}
+    b = {"image": {"pull": {"secrets": ["reg"]}}, "replicas": 3, "extra": {"x": 1}}
+    a_before, b_before = copy.deepcopy(a), copy.deepcopy(b)
+
+    out = deep_merge(a, b)
+
+    assert out == {
+        "image": {"tag": "1.0", "pull": {"policy": "Always", "secrets": ["reg"]}},
+        "replicas": 3,
+        "extra": {"x": 1},
+    }
+    assert a == a_before
+    assert b == b_before
+
+
+def test_deep_merge_non_dict_overrides_dict():
+    assert deep_merge({"a": {"b": 1}}, {"a": None}) == {"a": None}
+
+
+def test_deep_merge_into_updates_destination():
+    dst = {"a": {"b": 1}}
+    result = deep_merge_into(dst, {"a": {"c": 2}})
+    assert result is dst
+    assert dst == {"a": {"b": 1, "c": 2}}
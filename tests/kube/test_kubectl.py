@@ -0,0 +1,57 @@
+import pytest
+
+from daalu.kube.kubectl import KubectlError, KubectlRunner
+
+
+class FakeSSH:
+    def __init__(self, create_result):
+        self.create_result = create_result
+        self.commands = []
+        self.uploads = []
+
+    def put_text(self, content, remote_path, sudo=False):
+        self.uploads.append(remote_path)
+
+    def run(self, cmd, sudo=False):
+        self.commands.append(cmd)
+        if " create -f " in cmd:
+            return self.create_result
+        return 0, "", ""
+
+
+OBJECTS = [
+    {"apiVersion": "v1", "kind": "Secret", "metadata": {"name": "a"}},
+    {"apiVersion": "v1", "kind": "Secret", "metadata": {"name": "b"}},
+    {"apiVersion": "v1", "kind": "Secret", "metadata": {"name": "c"}},
+]
+
+
+def test_create_objects_ignores_already_exists():
+    ssh = FakeSSH(
+        (
+            1,
+            "secret/c created\n",
+            'Error from server (AlreadyExists): secrets "a" already exists\n'
+            'Error from server (AlreadyExists): secrets "b" already exists\n',
+        )
+    )
+
+    KubectlRunner(ssh=ssh).create_objects(OBJECTS)
+
+    assert ssh.commands == [
+        f"KUBECONFIG=/etc/kubernetes/admin.conf kubectl create -f {ssh.uploads[0]}"
+    ]
+
+
+def test_create_objects_raises_on_other_errors():
+    ssh = FakeSSH(
+        (
+            1,
+            "",
+            'Error from server (AlreadyExists): secrets "a" already exists\n'
+            'Error from server (Forbidden): secrets "b" is forbidden\n',
+        )
+    )
+
+    with pytest.raises(KubectlError, match="Forbidden"):
+        KubectlRunner(ssh=ssh).create_objects(OBJECTS)
@@ -0,0 +1,26 @@
+import os
+
+from daalu.utils.yaml_cache import load_yaml_file
+
+
+def test_load_yaml_file_returns_independent_copies(tmp_path):
+    path = tmp_path / "values.yaml"
+    path.write_text("image:\n  tag: '1.0'\n")
+
+    first = load_yaml_file(path)
+    first["image"]["tag"] = "mutated"
+
+    assert load_yaml_file(path) == {"image": {"tag": "1.0"}}
+
+
+def test_load_yaml_file_sees_edits(tmp_path):
+    path = tmp_path / "values.yaml"
+    path.write_text("replicas: 1\n")
+    assert load_yaml_file(path) == {"replicas": 1}
+
+    path.write_text("replicas: 3\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert load_yaml_file(path) == {"replicas": 3}
+
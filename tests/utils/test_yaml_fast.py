@@ -0,0 +1,23 @@
+import importlib
+
+import yaml
+
+from daalu.utils import yaml_fast
+
+
+def test_yaml_fast_uses_libyaml_when_available():
+    assert yaml_fast.HAS_LIBYAML == yaml.__with_libyaml__
+    assert yaml_fast.safe_load(b"a: [1, 2]\n") == {"a": [1, 2]}
+
+
+def test_yaml_fast_falls_back_without_libyaml(monkeypatch):
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        importlib.reload(yaml_fast)
+
+        assert yaml_fast.HAS_LIBYAML is False
+        assert yaml_fast._Loader is yaml.SafeLoader
+        assert yaml_fast.safe_load("a: [1, 2]\n") == {"a": [1, 2]}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(yaml_fast)